@@ -34,32 +34,48 @@ class Config:
 
     def __init__(self):
         """
-        Validate that all required environment-derived configuration values are present on the instance.
-        
-        Checks for presence of SUPABASE_URL, SUPABASE_ANON_KEY, DEEPGRAM_API_KEY, ELEVENLABS_API_KEY,
-        ELEVENLABS_VOICE_ID, GOOGLE_API_KEY, SIMLI_API_KEY, and SIMLI_FACE_ID and raises an error
-        if any are missing.
-        
+        Validate that all required environment-derived configuration values are present.
+
+        The check runs once per process (see `_validate_once`); later instances reuse the result.
+
         Raises:
             ValueError: If one or more required environment variables are not set; the exception message
             lists the missing variable names.
         """
-        required_vars = [
-            "SUPABASE_URL",
-            "SUPABASE_ANON_KEY",
-            "DEEPGRAM_API_KEY",
-            "ELEVENLABS_API_KEY",
-            "ELEVENLABS_VOICE_ID",
-            "GOOGLE_API_KEY",
-            "SIMLI_API_KEY",
-            "SIMLI_FACE_ID",
-        ]
-
-        missing = [var for var in required_vars if not getattr(self, var)]
-        if missing:
-            raise ValueError(
-                f"Missing required environment variables: {', '.join(missing)}"
-            )
+        _validate_once()
+
+
+REQUIRED_VARS = (
+    "SUPABASE_URL",
+    "SUPABASE_ANON_KEY",
+    "DEEPGRAM_API_KEY",
+    "ELEVENLABS_API_KEY",
+    "ELEVENLABS_VOICE_ID",
+    "GOOGLE_API_KEY",
+    "SIMLI_API_KEY",
+    "SIMLI_FACE_ID",
+)
+
+_validated = False
+
+
+def _validate_once():
+    """
+    Check that every variable in REQUIRED_VARS is set on Config, caching success.
+
+    Raises:
+        ValueError: If one or more required environment variables are not set.
+    """
+    global _validated
+    if _validated:
+        return
+
+    missing = [var for var in REQUIRED_VARS if not getattr(Config, var)]
+    if missing:
+        raise ValueError(
+            f"Missing required environment variables: {', '.join(missing)}"
+        )
+    _validated = True
 
 
 # Global config instance
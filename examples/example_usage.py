@@ -12,7 +12,7 @@ async def main():
     """
     Run an example interview flow that validates configuration, drives an InterviewBot with sample candidate data and questions, processes simulated responses, completes the interview, and ensures resources are cleaned up.
     
-    This coroutine performs a demonstration sequence: it validates InterviewConfig, instantiates an InterviewBot, starts an interview, processes a set of example responses for each question, completes the interview to obtain a final evaluation, and finally closes the bot. Progress and results are printed to stdout.
+    This coroutine performs a demonstration sequence: it validates InterviewConfig, instantiates an InterviewBot, starts an interview, processes the example responses for all questions concurrently, completes the interview to obtain a final evaluation, and finally closes the bot. Progress and results are printed to stdout.
     """
 
     # Validate configuration
@@ -49,11 +49,16 @@ async def main():
             "I want this position because I'm passionate about AI",
         ]
 
-        # Process each response
-        for i, (question, response) in enumerate(zip(questions, responses), 1):
-            print(f"\nProcessing Question {i}...")
-            result = await bot.process_response(question, response)
-            print(f"Response processed: {result['status']}")
+        # Process the (independent) responses concurrently
+        print(f"\nProcessing {len(questions)} questions...")
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(bot.process_response(question, response))
+                for question, response in zip(questions, responses)
+            ]
+
+        for i, task in enumerate(tasks, 1):
+            print(f"Question {i} response processed: {task.result()['status']}")
 
         # Complete interview
         print("\nCompleting interview...")
@@ -1,22 +1,140 @@
 import os
 import sys
+import json
+import zlib
+import hashlib
+import importlib.util
+from collections import OrderedDict
 from dotenv import load_dotenv
 from loguru import logger
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 
 # Import Supabase services and models
-from ..context_service.services import QueueService
+from ..context_service.services import get_queue_service
 from ..context_service import InterviewContext
 
-# Import Gemini LLM
+# Redis persists conversation history across restarts/workers when configured
 try:
-    from google import genai
+    import redis.asyncio as aioredis
 except ImportError:
-    logger.warning("google-genai not installed, LLM features will be disabled")
-    genai = None
+    aioredis = None
 
-load_dotenv(override=True)
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+SUMMARY_MODEL = "gemini-2.0-flash-lite"
+CONTEXT_CACHE_TTL = "3600s"
+MAX_TURNS = 50  # recent history entries kept verbatim after the pinned first message
+HISTORY_TTL = 3600  # seconds a persisted conversation history is kept in Redis
+_SUMMARY_OPEN, _SUMMARY_CLOSE = "<SUMMARY>", "</SUMMARY>"
+
+# Bounds concurrent Gemini generations across all chatbot sessions in the
+# process; sized from GEMINI_CONCURRENCY on first use (after .env is loaded)
+_gemini_semaphore: Optional[asyncio.Semaphore] = None
+
+# Exact-match reply cache shared by all sessions: identical context and
+# conversation (e.g. the opening turn of every session for an interview)
+# reuse the earlier reply instead of calling Gemini again
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 1024
+
+# Shared HTTP/2 keep-alive transport for every Gemini client in the process
+_gemini_transport = None
+
+# Gemini client shared by all sessions; availability is decided (and any
+# warning logged) once per process instead of on every BasicChatbot
+_llm_available: Optional[bool] = None
+_llm_client = None
+
+# Redis client for conversation history (None when unavailable or not configured)
+_redis = None
+
+_env_loaded = False
+
+
+def _ensure_env():
+    """Load .env once, on first use rather than at import time"""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv(override=True)
+        _env_loaded = True
+
+
+def _get_gemini_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide Gemini generation semaphore"""
+    global _gemini_semaphore
+    if _gemini_semaphore is None:
+        _ensure_env()
+        _gemini_semaphore = asyncio.Semaphore(int(os.getenv("GEMINI_CONCURRENCY", "16")))
+    return _gemini_semaphore
+
+
+def _gemini_http_options() -> "types.HttpOptions":
+    """
+    HTTP options routing Gemini's async requests through the shared transport
+    (HTTP/2 when the h2 package is installed, HTTP/1.1 otherwise)
+    """
+    global _gemini_transport
+    import httpx
+    from google.genai import types
+
+    if _gemini_transport is None:
+        # httpx's HTTP/2 support needs the optional h2 package
+        http2 = importlib.util.find_spec("h2") is not None
+        if not http2:
+            logger.info("h2 not installed, Gemini requests will use HTTP/1.1")
+        _gemini_transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            retries=2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return types.HttpOptions(async_client_args={"transport": _gemini_transport})
+
+
+def _get_llm_client():
+    """Get the shared Gemini client, or None when Gemini is not configured"""
+    global _llm_available, _llm_client
+    if _llm_available is None:
+        _llm_available = False
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if api_key:
+            try:
+                # The SDK is only imported when it will be used
+                from google import genai
+
+                _llm_client = genai.Client(
+                    api_key=api_key, http_options=_gemini_http_options()
+                )
+                _llm_available = True
+            except ImportError:
+                logger.warning("google-genai not installed, LLM features will be disabled")
+            except Exception as e:
+                logger.error(f"Failed to initialize Gemini: {e}")
+        else:
+            logger.warning("GOOGLE_API_KEY not found")
+    return _llm_client
+
+
+def _get_redis():
+    """Get the shared Redis client, or None when Redis is not configured"""
+    global _redis
+    if _redis is None and aioredis is not None and os.getenv("REDIS_URL"):
+        _redis = aioredis.from_url(os.getenv("REDIS_URL"), decode_responses=False)
+    return _redis
+
+
+def _summary_text(entry: "types.Content") -> Optional[str]:
+    """The text of a history summary entry, or None if entry is not one"""
+    text = entry.parts[0].text or ""
+    if text.startswith(_SUMMARY_OPEN) and text.endswith(_SUMMARY_CLOSE):
+        return text[len(_SUMMARY_OPEN) : -len(_SUMMARY_CLOSE)]
+    return None
+
+
+def _content(role: str, text: str) -> "types.Content":
+    """Build a Content entry once so requests don't re-validate history dicts"""
+    from google.genai import types
+
+    return types.Content(role=role, parts=[types.Part.from_text(text=text)])
 
 
 class BasicChatbot:
@@ -26,28 +144,21 @@ class BasicChatbot:
         """
         Create a BasicChatbot bound to the given authentication token and prepare its runtime state.
         
-        Initializes instance attributes used by the chatbot (authentication token, interview context placeholder, optional LLM client, and conversation history). If the Google Gemini client library is available and a GOOGLE_API_KEY environment variable is present, attempts to initialize an LLM client; otherwise leaves the client unset and records an appropriate warning.
+        Initializes instance attributes used by the chatbot (authentication token, interview context placeholder, optional LLM client, and conversation history). If a GOOGLE_API_KEY environment variable is present, uses the process-wide Gemini client (created on first use, deferring the SDK import so key-less paths skip it); otherwise leaves the client unset. Any warning about Gemini being unavailable is logged once per process.
          
         Parameters:
         	auth_token (str): Authentication token used to fetch interview context for this chat session.
         """
+        _ensure_env()
         self.auth_token = auth_token
         self.interview_context: Optional[InterviewContext] = None
-        self.llm_client = None
+        self.llm_client = _get_llm_client()
         self.conversation_history = []
-
-        # Initialize Gemini if available
-        if genai:
-            try:
-                api_key = os.getenv("GOOGLE_API_KEY")
-                if api_key:
-                    self.llm_client = genai.Client(api_key=api_key)
-                else:
-                    logger.warning("GOOGLE_API_KEY not found")
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
-        else:
-            logger.warning("google-genai not available")
+        # Gemini cached content holding the formatted interview context
+        # (None until first tried, False if caching is unavailable)
+        self._context_cache = None
+        # blake2b state over the interview and its encoded context, built once
+        self._cache_key_base = None
 
     async def initialize_context(self) -> bool:
         """
@@ -59,7 +170,7 @@ class BasicChatbot:
             True if the interview context was retrieved and assigned to `self.interview_context`, False otherwise.
         """
         try:
-            queue_service = QueueService()
+            queue_service = get_queue_service()
             interviewer_record = await queue_service.get_interview_context_from_queue(
                 self.auth_token
             )
@@ -75,72 +186,263 @@ class BasicChatbot:
         except Exception:
             return False
 
-    async def chat(self, message: str) -> str:
+    async def chat(self, message: str) -> AsyncIterator[str]:
         """
-        Send a user message to the interview chatbot and return the bot's reply.
+        Send a user message to the interview chatbot and stream the bot's reply.
         
-        Processes the provided message using the stored interview context and the optional Gemini LLM client, maintaining a per-session conversation history. If the interview context is not initialized, returns an instruction to call initialize_context(). If the LLM client is not available, returns a deterministic fallback string that references the candidate and job title and echoes the user's message. On unexpected errors, returns a brief apology that includes the original user message.
+        Processes the provided message using the stored interview context and the optional Gemini LLM client, maintaining a per-session conversation history. Model output is yielded chunk by chunk as it arrives from Gemini and the full reply is recorded in the history once the stream completes. If the interview context is not initialized, yields an instruction to call initialize_context(). If the LLM client is not available, yields a deterministic fallback string that references the candidate and job title and echoes the user's message. On unexpected errors, yields a brief apology that includes the original user message.
         
         Parameters:
             message (str): The user's chat message to send to the bot.
         
-        Returns:
-            str: The chatbot's reply. This may be:
+        Yields:
+            str: Pieces of the chatbot's reply. This may be:
                 - "Context not initialized. Please call initialize_context() first." if context is missing,
                 - a deterministic fallback mentioning the candidate and job title when the LLM client is unavailable,
-                - the model-generated response when the LLM is used,
+                - chunks of the model-generated response when the LLM is used,
                 - or an apology message containing the original user message if an error occurs.
         """
         if not self.interview_context:
-            return "Context not initialized. Please call initialize_context() first."
+            yield "Context not initialized. Please call initialize_context() first."
+            return
 
         if not self.llm_client:
-            return f"I understand you're interviewing {self.interview_context.candidate_name} for the {self.interview_context.job_title} position. You said: {message}"
+            yield f"I understand you're interviewing {self.interview_context.candidate_name} for the {self.interview_context.job_title} position. You said: {message}"
+            return
 
         try:
             # Initialize conversation if this is the first message
             if not self.conversation_history:
-                formatted_context = self.interview_context.format_full_context()
-                self.conversation_history = [
-                    {
-                        "role": "user",
-                        "parts": [{"text": f"START_INTERVIEW\n\n{formatted_context}"}],
-                    },
-                ]
-
-                # Get initial response from LLM
-                response = await self.llm_client.aio.models.generate_content(
-                    model="gemini-2.0-flash-exp", contents=self.conversation_history
-                )
-                initial_response = response.text
+                restored = await self._load_history()
+                self.conversation_history = [await self._start_content()]
+                if restored:
+                    # Resume a conversation persisted by an earlier process
+                    self.conversation_history.extend(restored[1:])
+                    self.conversation_history.append(_content("user", message))
+            else:
+                # Add user message to history
+                self.conversation_history.append(_content("user", message))
+
+            cache_key = self._response_cache_key()
+            cached_response = _RESPONSE_CACHE.get(cache_key)
+            if cached_response is not None:
+                _RESPONSE_CACHE.move_to_end(cache_key)
+                yield cached_response
+                self.conversation_history.append(_content("model", cached_response))
+                await self._trim_history()
+                await self._save_history()
+                return
+
+            # Stream the response, yielding chunks as they arrive. Generation
+            # runs in its own task so the semaphore slot is released when
+            # Gemini finishes, not when the caller finishes consuming
+            pieces = []
+            queue: asyncio.Queue = asyncio.Queue()
+            producer = asyncio.create_task(self._generate(queue))
+            producer.add_done_callback(lambda _: queue.put_nowait(None))
+            try:
+                while True:
+                    piece = await queue.get()
+                    if piece is None:
+                        break
+                    pieces.append(piece)
+                    yield piece
+                # Re-raise a failed generation
+                producer.result()
+            finally:
+                producer.cancel()
 
-                # Add to history
-                self.conversation_history.append(
-                    {"role": "model", "parts": [{"text": initial_response}]}
-                )
+            # Add bot response to history
+            bot_response = "".join(pieces)
+            self.conversation_history.append(_content("model", bot_response))
+
+            _RESPONSE_CACHE[cache_key] = bot_response
+            if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
 
-                return initial_response
+            await self._trim_history()
+            await self._save_history()
+
+        except Exception:
+            yield f"I apologize, but I encountered an error. You said: {message}"
+
+    async def _generate(self, queue: asyncio.Queue):
+        """Stream a Gemini reply to the current history into queue"""
+        async with _get_gemini_semaphore():
+            async for chunk in await self.llm_client.aio.models.generate_content_stream(
+                model=GEMINI_MODEL,
+                contents=self.conversation_history,
+                config=self._generation_config(),
+            ):
+                if chunk.text:
+                    queue.put_nowait(chunk.text)
+
+    async def _start_content(self) -> "types.Content":
+        """Build the START_INTERVIEW message, creating the context cache if needed"""
+        formatted_context = self.interview_context.format_full_context()
+        if self._context_cache is None:
+            self._context_cache = await self._create_context_cache(formatted_context)
+
+        if self._context_cache:
+            # Context is served from the cache, history only holds the turns
+            return _content("user", "START_INTERVIEW")
+        return _content("user", f"START_INTERVIEW\n\n{formatted_context}")
+
+    def _history_key(self) -> str:
+        return f"hist:{self.interview_context.interview_id}"
+
+    async def _load_history(self) -> List["types.Content"]:
+        """Load a persisted conversation history from Redis (empty if none)"""
+        redis_client = _get_redis()
+        if redis_client is None:
+            return []
 
-            # Add user message to history
-            self.conversation_history.append(
-                {"role": "user", "parts": [{"text": message}]}
+        try:
+            raw = await redis_client.get(self._history_key())
+            if not raw:
+                return []
+            return [
+                _content(entry["role"], entry["text"])
+                for entry in json.loads(zlib.decompress(raw))
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to load conversation history: {e}")
+            return []
+
+    async def _save_history(self):
+        """Persist the conversation history to Redis, compressed, with a TTL"""
+        redis_client = _get_redis()
+        if redis_client is None:
+            return
+
+        entries = [
+            {"role": entry.role, "text": entry.parts[0].text}
+            for entry in self.conversation_history
+        ]
+        try:
+            await redis_client.setex(
+                self._history_key(),
+                HISTORY_TTL,
+                zlib.compress(json.dumps(entries).encode()),
             )
+        except Exception as e:
+            logger.warning(f"Failed to save conversation history: {e}")
+
+    def _response_cache_key(self) -> str:
+        """Hash the interview, its formatted context and the conversation so far"""
+        if self._cache_key_base is None:
+            # The (large) context is encoded and hashed once per session
+            self._cache_key_base = hashlib.blake2b(digest_size=16)
+            self._cache_key_base.update(str(self.interview_context.interview_id).encode())
+            self._cache_key_base.update(
+                self.interview_context.format_full_context().encode()
+            )
+
+        digest = self._cache_key_base.copy()
+        # The first entry is START_INTERVIEW (plus the context hashed above)
+        for entry in self.conversation_history[1:]:
+            digest.update(b"\x00" + entry.role.encode() + b"\x00")
+            digest.update(entry.parts[0].text.encode())
+        return digest.hexdigest()
 
-            # Generate response
+    async def _trim_history(self):
+        """
+        Keep the conversation history bounded.
+
+        The first message (START_INTERVIEW, plus the context when it is not
+        cached) is never touched so the request prefix stays stable. Once the
+        history outgrows it, a summary slot and MAX_TURNS entries, everything
+        but the last MAX_TURNS // 2 entries is folded (together with any
+        previous summary) into a single summary, so summarizing happens once
+        per MAX_TURNS // 2 entries rather than on every turn.
+        """
+        history = self.conversation_history
+        if len(history) <= MAX_TURNS + 2:
+            return
+
+        keep = MAX_TURNS // 2
+        older = history[1:-keep]
+        previous_summary = _summary_text(older[0]) if older else None
+        if previous_summary is not None:
+            older = older[1:]
+
+        middle = "\n".join(f"{entry.role}: {entry.parts[0].text}" for entry in older)
+        prompt = "Summarize succinctly: " + middle
+        if previous_summary:
+            prompt = (
+                "Update this summary of an interview with the turns that follow it; "
+                "reply with the complete updated summary, succinctly.\n\n"
+                f"Summary so far:\n{previous_summary}\n\nNew turns:\n{middle}"
+            )
+        try:
             response = await self.llm_client.aio.models.generate_content(
-                model="gemini-2.0-flash-exp", contents=self.conversation_history
+                model=SUMMARY_MODEL,
+                contents=[_content("user", prompt)],
             )
-            bot_response = response.text
+        except Exception as e:
+            logger.warning(f"Failed to summarize conversation history: {e}")
+            return
 
-            # Add bot response to history
-            self.conversation_history.append(
-                {"role": "model", "parts": [{"text": bot_response}]}
+        summary = _content("user", f"{_SUMMARY_OPEN}{response.text}{_SUMMARY_CLOSE}")
+        history[1:-keep] = [summary]
+
+    async def reply(self, message: str) -> str:
+        """Send a message and return the complete (non-streamed) reply."""
+        return "".join([piece async for piece in self.chat(message)])
+
+    @staticmethod
+    async def chat_batch(
+        bots: List["BasicChatbot"], messages: List[str]
+    ) -> List[str]:
+        """
+        Send one message to each of several chatbot sessions concurrently.
+
+        Gemini calls overlap instead of running one after another; overall
+        concurrency is still bounded by GEMINI_CONCURRENCY.
+
+        Returns:
+            The complete replies, in the same order as bots.
+        """
+        return await asyncio.gather(
+            *(bot.reply(message) for bot, message in zip(bots, messages))
+        )
+
+    async def _create_context_cache(self, formatted_context: str):
+        """
+        Upload the formatted interview context to Gemini's context cache.
+
+        Returns:
+            The CachedContent, or False when caching is unavailable (e.g. the
+            context is below the model's minimum cacheable size), in which case
+            the context is sent inline with the conversation.
+        """
+        try:
+            return await self.llm_client.aio.caches.create(
+                model=GEMINI_MODEL,
+                config={
+                    "contents": [_content("user", formatted_context)],
+                    "ttl": CONTEXT_CACHE_TTL,
+                },
             )
+        except Exception as e:
+            logger.warning(f"Context caching unavailable, sending context inline: {e}")
+            return False
 
-            return bot_response
+    def _generation_config(self) -> Optional[Dict[str, Any]]:
+        """Generation config pointing at the cached context, if any"""
+        if self._context_cache:
+            return {"cached_content": self._context_cache.name}
+        return None
 
-        except Exception:
-            return f"I apologize, but I encountered an error. You said: {message}"
+    async def close(self):
+        """Delete the cached interview context and reset the conversation."""
+        if self._context_cache and self.llm_client:
+            try:
+                await self.llm_client.aio.caches.delete(name=self._context_cache.name)
+            except Exception as e:
+                logger.warning(f"Failed to delete context cache: {e}")
+        self._context_cache = None
+        self.conversation_history = []
 
 
 # CLI usage
@@ -150,7 +452,7 @@ async def main():
     
     This CLI expects an authentication token as the first command-line argument. It initializes a BasicChatbot with that token, loads interview context, prints a brief summary of the retrieved context (interview ID, candidate, job title, question count), and enters a REPL-style loop reading user messages and printing bot responses until the user types a quit command or triggers an interrupt. Exits with a non-zero status on initialization failure or unhandled errors.
     """
-    import sys
+    _ensure_env()
 
     if len(sys.argv) < 2:
         print("Usage: python -m interview.bots.basicbot <auth_token>")
@@ -180,16 +482,29 @@ async def main():
                 if message.lower() in ["quit", "exit", "q"]:
                     print("Goodbye!")
                     break
-                response = await bot.chat(message)
-                print(f"Bot: {response}")
+                print("Bot: ", end="", flush=True)
+                async for piece in bot.chat(message):
+                    print(piece, end="", flush=True)
+                print()
             except (KeyboardInterrupt, EOFError):
                 print("\nGoodbye!")
                 break
 
+        await bot.close()
+
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop (installed with uvicorn[standard]) speeds up the CLI's socket I/O
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
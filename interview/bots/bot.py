@@ -4,6 +4,7 @@ Main bot class that integrates all interview functionality
 """
 
 import asyncio
+import io
 from typing import Optional, Dict, Any, List
 from ..config import InterviewConfig
 from ..context_service_integration import ContextService
@@ -106,19 +107,26 @@ class InterviewBot:
             # Mark interview as complete
             self.current_interview.complete()
 
-            # Generate final evaluation
+            # Generate final evaluation; split responses and questions in one pass
+            responses = []
+            questions = []
+            for r in self.current_interview.responses:
+                responses.append(r["response"])
+                questions.append(r["question"])
+
             interview_data = {
                 "id": str(self.current_interview.id),
-                "responses": [r["response"] for r in self.current_interview.responses],
-                "questions": [r["question"] for r in self.current_interview.responses],
+                "responses": responses,
+                "questions": questions,
             }
 
-            final_evaluation = await self.evaluator.evaluate_interview(interview_data)
-
-            # Save transcript
+            # Evaluation and transcript save are independent; run them concurrently
             transcript = self._generate_transcript()
-            await self.context_service.save_transcript(
-                str(self.current_interview.id), transcript
+            final_evaluation, _ = await asyncio.gather(
+                self.evaluator.evaluate_interview(interview_data),
+                self.context_service.save_transcript(
+                    str(self.current_interview.id), transcript
+                ),
             )
 
             result = {
@@ -149,24 +157,24 @@ class InterviewBot:
         if not self.current_interview:
             return ""
 
-        transcript_lines = [
-            f"Interview Transcript - {self.current_interview.candidate.first_name} {self.current_interview.candidate.last_name}",
-            f"Started: {self.current_interview.start_time}",
-            f"Completed: {self.current_interview.end_time}",
-            "",
-        ]
+        # Stream into one buffer instead of building a list of fragments to join
+        buffer = io.StringIO()
+        write = buffer.write
+
+        write(
+            f"Interview Transcript - {self.current_interview.candidate.first_name} {self.current_interview.candidate.last_name}\n"
+            f"Started: {self.current_interview.start_time}\n"
+            f"Completed: {self.current_interview.end_time}\n"
+        )
 
         for i, response in enumerate(self.current_interview.responses, 1):
-            transcript_lines.extend(
-                [
-                    f"Question {i}: {response['question']}",
-                    f"Response: {response['response']}",
-                    f"Evaluation: {response['evaluation']}",
-                    "",
-                ]
+            write(
+                f"\nQuestion {i}: {response['question']}\n"
+                f"Response: {response['response']}\n"
+                f"Evaluation: {response['evaluation']}\n"
             )
 
-        return "\n".join(transcript_lines)
+        return buffer.getvalue()
 
     async def get_interview_context(self, auth_token: str) -> Optional[Dict[str, Any]]:
         """Get interview context by auth token"""
@@ -0,0 +1,99 @@
+"""
+LLM services for the interview bots
+"""
+
+from typing import Any, List, Optional
+
+from loguru import logger
+
+from pipecat.services.google.llm import GoogleLLMService
+
+# Lifetime of a session's cached system prompt
+CONTEXT_CACHE_TTL = "1800s"
+
+
+class CachedGoogleLLMService(GoogleLLMService):
+    """
+    GoogleLLMService that serves a static system prompt (and tools) from
+    Gemini's context cache.
+
+    create_context_cache() uploads the prompt once per session; afterwards
+    every request whose system instruction is still that prompt references
+    the cache instead of resending it. Requests with any other system
+    instruction (or when caching is unavailable) are sent unchanged.
+    """
+
+    def __init__(self, *, model: str, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self._cache_model = model
+        self._cache_name: Optional[str] = None
+        self._cached_system_instruction: Optional[str] = None
+        self.cached_prompt_tokens: Optional[int] = None
+
+        models = self._client.aio.models
+        generate_content_stream = models.generate_content_stream
+
+        async def cached_generate_content_stream(*, config=None, **kwargs):
+            return await generate_content_stream(
+                config=self._with_cached_content(config), **kwargs
+            )
+
+        models.generate_content_stream = cached_generate_content_stream
+
+    async def create_context_cache(
+        self, system_instruction: str, tools: Optional[List[Any]] = None
+    ):
+        """Upload system_instruction (and tools) to Gemini's context cache"""
+        await self.delete_context_cache()
+        try:
+            cache = await self._client.aio.caches.create(
+                model=self._cache_model,
+                config={
+                    "system_instruction": system_instruction,
+                    "tools": tools,
+                    "ttl": CONTEXT_CACHE_TTL,
+                },
+            )
+        except Exception as e:
+            # e.g. the prompt is below the model's minimum cacheable size
+            logger.warning(f"Context caching unavailable, sending prompt inline: {e}")
+            return
+
+        self._cache_name = cache.name
+        self._cached_system_instruction = system_instruction
+        # The cache reports the prompt's token count, so it never needs a
+        # separate count_tokens call
+        self.cached_prompt_tokens = getattr(
+            cache.usage_metadata, "total_token_count", None
+        )
+        logger.info(
+            f"Cached system prompt as {cache.name} ({self.cached_prompt_tokens} tokens)"
+        )
+
+    async def delete_context_cache(self):
+        """Delete the session's cached system prompt, if any"""
+        if not self._cache_name:
+            return
+        name, self._cache_name = self._cache_name, None
+        self._cached_system_instruction = None
+        try:
+            await self._client.aio.caches.delete(name=name)
+        except Exception as e:
+            logger.warning(f"Failed to delete context cache: {e}")
+
+    def _with_cached_content(self, config):
+        if (
+            not self._cache_name
+            or config is None
+            or config.system_instruction != self._cached_system_instruction
+        ):
+            return config
+        # The cache carries the system instruction and tools; the request may not
+        return config.model_copy(
+            update={
+                "cached_content": self._cache_name,
+                "system_instruction": None,
+                "tools": None,
+                "tool_config": None,
+            }
+        )
@@ -0,0 +1,504 @@
+"""
+Custom Pipecat frame processors for the interview bots
+"""
+
+import asyncio
+import random
+import re
+import weakref
+from collections import deque
+from typing import Deque, Iterable, Optional, Set, Tuple
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    FunctionCallCancelFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    FunctionCallResultProperties,
+    FunctionCallsStartedFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMContextFrame,
+    LLMTextFrame,
+    StartInterruptionFrame,
+    TranscriptionFrame,
+    TTSSpeakFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.llm_service import FunctionCallParams
+
+# Frames produced by an LLM for a response; only the race winner's pass downstream
+_LLM_RESPONSE_FRAMES = (
+    LLMFullResponseStartFrame,
+    LLMFullResponseEndFrame,
+    LLMTextFrame,
+    FunctionCallsStartedFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    FunctionCallCancelFrame,
+)
+
+# Frames that show an LLM has actually started answering
+_LLM_OUTPUT_FRAMES = (LLMTextFrame, FunctionCallsStartedFrame, FunctionCallInProgressFrame)
+
+# Text ending a sentence, possibly followed by whitespace
+_SENTENCE_END = re.compile(r"[.?!]\s*$")
+# Flush on a comma once the buffer has this many words
+SENTENCE_MIN_CLAUSE_WORDS = 4
+# Flush at the last word boundary once the buffer has this many words
+SENTENCE_MAX_WORDS = 80
+
+# Spoken when the LLM hasn't started answering FILLER_DELAY seconds after the user's turn
+FILLER_PHRASES = ["Let me think...", "Good question,", "Okay,", "Alright,"]
+FILLER_DELAY = 0.2
+
+
+class LLMRace:
+    """
+    Shared state for hedged LLM branches of a ParallelPipeline.
+
+    Each round (one response from every branch), the first LLM to produce
+    output wins; the other branches' responses are dropped.
+    """
+
+    def __init__(self):
+        self.winner = None
+        self._participants = set()
+        self._finished = set()
+
+    def register(self, llm):
+        self._participants.add(llm)
+
+    def claim(self, llm) -> bool:
+        """Claim the current round for llm; True if llm is (now) the winner"""
+        if self.winner is None:
+            self.winner = llm
+            logger.debug(f"LLM race won by {llm}")
+        return self.winner is llm
+
+    def finish(self, llm) -> bool:
+        """Record that llm finished its response; reset (and return True) once every branch has"""
+        self._finished.add(llm)
+        if self._finished >= self._participants:
+            self.reset()
+            return True
+        return False
+
+    def reset(self):
+        self.winner = None
+        self._finished.clear()
+
+    def guard(self, handler):
+        """Wrap a function-call handler so only the winning LLM's call runs"""
+
+        async def guarded(params: FunctionCallParams):
+            if not self.claim(params.llm):
+                await params.result_callback(
+                    {"status": "skipped"},
+                    properties=FunctionCallResultProperties(run_llm=False),
+                )
+                return
+            await handler(params)
+
+        return guarded
+
+
+class LLMRaceProcessor(FrameProcessor):
+    """Placed after an LLM in a hedged branch; passes its response only if it won the race"""
+
+    def __init__(self, race: LLMRace, llm, **kwargs):
+        super().__init__(**kwargs)
+        self._race = race
+        self._llm = llm
+        self._pending = []
+        race.register(llm)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartInterruptionFrame):
+            self._pending = []
+            self._race.reset()
+
+        if direction != FrameDirection.DOWNSTREAM or not isinstance(
+            frame, _LLM_RESPONSE_FRAMES
+        ):
+            await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, _LLM_OUTPUT_FRAMES):
+            self._race.claim(self._llm)
+
+        if self._race.winner is None:
+            # Undecided (e.g. response start): hold until this branch wins or loses
+            self._pending.append(frame)
+        elif self._race.winner is self._llm:
+            for pending in self._pending:
+                await self.push_frame(pending, direction)
+            self._pending = []
+            await self.push_frame(frame, direction)
+        else:
+            self._pending = []
+
+        if isinstance(frame, LLMFullResponseEndFrame):
+            pending, self._pending = self._pending, []
+            if self._race.finish(self._llm) and pending:
+                # No branch produced output this round (e.g. a cancelled
+                # speculative run); pass one empty response so downstream
+                # start/end pairing stays intact
+                for pending_frame in pending:
+                    await self.push_frame(pending_frame, direction)
+
+
+class _LLMRun:
+    """One context handed to the LLM, in the order the LLM will answer them"""
+
+    def __init__(
+        self, speculative: bool, text: str = "", context: Optional[LLMContext] = None
+    ):
+        self.speculative = speculative
+        self.text = text
+        self.context = context
+        self.state = "pending" if speculative else "committed"
+        self.buffer = []
+        # (LLM service, generation task) pairs currently producing this run
+        self.tasks: Set[Tuple[FrameProcessor, asyncio.Task]] = set()
+        # Speculative runs: resolves True on commit, False on discard
+        self.resolved: Optional[asyncio.Future] = None
+
+    def resolve(self, committed: bool):
+        if self.resolved is not None and not self.resolved.done():
+            self.resolved.set_result(committed)
+
+
+class SpeculativeLLM:
+    """
+    Start LLM inference on the user's finalized STT segments before the turn
+    analyzer confirms end-of-turn, and only release the response once it does.
+
+    Three processors share this state:
+      - listener(): after STT; starts a speculative run on each final segment,
+        cancelling the previous one for the turn (the text has grown)
+      - gate(): between the user context aggregator and the LLM; when the real
+        end-of-turn context arrives it commits the speculative run if the user
+        text matches (swallowing the duplicate context), otherwise cancels it
+      - release(): after the LLM; holds speculative output until committed
+
+    The LLM services' _process_context is wrapped so a superseded run's
+    generation is cancelled (without interrupting the rest of the pipeline),
+    and function-call handlers must be wrapped with guard() so a speculative
+    run's tool calls only take effect once it is committed.
+    """
+
+    def __init__(
+        self,
+        llm: FrameProcessor,
+        context: LLMContext,
+        services: Iterable[FrameProcessor] = (),
+    ):
+        self._llm = llm
+        self._context = context
+        self._turn_text = ""
+        self._speculation: Optional[_LLMRun] = None
+        self._runs: Deque[_LLMRun] = deque()
+        # Speculative context -> its run (entries go away with the context)
+        self._run_of: "weakref.WeakKeyDictionary[LLMContext, _LLMRun]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._listener = _SpeculationListener(self)
+        self._gate = _SpeculationGate(self)
+        self._release = _SpeculationRelease(self)
+        for service in services or (llm,):
+            self._hook(service)
+
+    def listener(self) -> FrameProcessor:
+        return self._listener
+
+    def gate(self) -> FrameProcessor:
+        return self._gate
+
+    def release(self) -> FrameProcessor:
+        return self._release
+
+    def guard(self, handler):
+        """Wrap a function-call handler so a speculative run's call waits for its commit"""
+
+        async def guarded(params: FunctionCallParams):
+            run = self._run_of.get(params.context)
+            if run is not None and not await run.resolved:
+                await params.result_callback(
+                    {"status": "skipped"},
+                    properties=FunctionCallResultProperties(run_llm=False),
+                )
+                return
+            await handler(params)
+
+        return guarded
+
+    def _hook(self, service: FrameProcessor):
+        process_context = service._process_context
+
+        async def speculative_process_context(context):
+            run = self._run_of.get(context)
+            if run is None:
+                return await process_context(context)
+            if run.state == "discarded":
+                # Superseded before the LLM got to it
+                return
+
+            # Run the generation as its own task so _discard can cancel it
+            # without cancelling the service's frame processing
+            task = service.create_task(process_context(context))
+            entry = (service, task)
+            run.tasks.add(entry)
+            try:
+                await task
+            except asyncio.CancelledError:
+                if not task.done():
+                    # The service itself is being cancelled (e.g. interruption)
+                    task.cancel()
+                    raise
+                if run.state != "discarded":
+                    raise
+            finally:
+                run.tasks.discard(entry)
+
+        service._process_context = speculative_process_context
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.split())
+
+    async def _discard(self, run: _LLMRun):
+        run.state = "discarded"
+        run.buffer = []
+        run.resolve(False)
+        for service, task in list(run.tasks):
+            await service.cancel_task(task)
+
+    async def _on_final_segment(self, text: str):
+        self._turn_text = f"{self._turn_text} {text}".strip()
+        stale = self._speculation
+        if stale is not None and stale.state == "pending":
+            # The turn grew; its answer would not match, so stop generating it
+            await self._discard(stale)
+
+        speculative_context = LLMContext(
+            messages=[
+                *self._context.get_messages(),
+                {"role": "user", "content": self._turn_text},
+            ],
+            tools=self._context.tools,
+            tool_choice=self._context.tool_choice,
+        )
+        run = _LLMRun(
+            speculative=True,
+            text=self._normalize(self._turn_text),
+            context=speculative_context,
+        )
+        run.resolved = asyncio.get_running_loop().create_future()
+        self._run_of[speculative_context] = run
+        self._speculation = run
+        self._runs.append(run)
+        await self._llm.queue_frame(LLMContextFrame(context=speculative_context))
+
+    async def _on_turn_context(self, context: LLMContext) -> bool:
+        """Handle the real end-of-turn context; True if a speculative run covers it"""
+        run = self._speculation
+        self._speculation = None
+        self._turn_text = ""
+
+        messages = context.get_messages()
+        user_text = ""
+        if messages and messages[-1].get("role") == "user":
+            content = messages[-1].get("content")
+            user_text = content if isinstance(content, str) else ""
+
+        if run is not None and run.text == self._normalize(user_text):
+            await self._release.commit(run)
+            return True
+
+        if run is not None:
+            await self._discard(run)
+        self._runs.append(_LLMRun(speculative=False))
+        return False
+
+    def _reset(self):
+        # The interruption cancels any generation in progress
+        for run in self._runs:
+            if run.state == "pending":
+                run.state = "discarded"
+                run.buffer = []
+                run.resolve(False)
+        self._turn_text = ""
+        self._speculation = None
+        self._runs.clear()
+
+
+class _SpeculationListener(FrameProcessor):
+    def __init__(self, speculation: SpeculativeLLM, **kwargs):
+        super().__init__(**kwargs)
+        self._speculation = speculation
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        await self.push_frame(frame, direction)
+
+        if isinstance(frame, StartInterruptionFrame):
+            self._speculation._reset()
+        elif isinstance(frame, TranscriptionFrame) and frame.text.strip():
+            await self._speculation._on_final_segment(frame.text)
+
+
+class _SpeculationGate(FrameProcessor):
+    def __init__(self, speculation: SpeculativeLLM, **kwargs):
+        super().__init__(**kwargs)
+        self._speculation = speculation
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if direction == FrameDirection.DOWNSTREAM and isinstance(frame, LLMContextFrame):
+            if await self._speculation._on_turn_context(frame.context):
+                # The speculative run already answers this context
+                return
+
+        await self.push_frame(frame, direction)
+
+
+class _SpeculationRelease(FrameProcessor):
+    def __init__(self, speculation: SpeculativeLLM, **kwargs):
+        super().__init__(**kwargs)
+        self._speculation = speculation
+        self._current: Optional[_LLMRun] = None
+
+    async def commit(self, run: _LLMRun):
+        run.state = "committed"
+        run.resolve(True)
+        buffered, run.buffer = run.buffer, []
+        for frame in buffered:
+            await self.push_frame(frame, FrameDirection.DOWNSTREAM)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if direction == FrameDirection.UPSTREAM and isinstance(frame, LLMContextFrame):
+            # Re-runs requested from downstream (e.g. after a function call)
+            self._speculation._runs.append(_LLMRun(speculative=False))
+
+        if direction != FrameDirection.DOWNSTREAM or not isinstance(
+            frame, _LLM_RESPONSE_FRAMES
+        ):
+            await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, LLMFullResponseStartFrame):
+            runs = self._speculation._runs
+            self._current = runs.popleft() if runs else None
+
+        run = self._current
+        if run is None or run.state == "committed":
+            await self.push_frame(frame, direction)
+        elif run.state == "pending":
+            run.buffer.append(frame)
+
+        if isinstance(frame, LLMFullResponseEndFrame):
+            self._current = None
+
+
+class SentenceAggregator(FrameProcessor):
+    """
+    Placed between the LLM and TTS; groups streamed LLM tokens into sentences
+    (or long clauses) so TTS can start on the first one while the LLM is
+    still generating. The TTS service should have its own sentence
+    aggregation disabled.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._buffer = ""
+
+    def _split_point(self) -> int:
+        """Index up to which the buffer should be flushed now, or 0"""
+        buffer = self._buffer
+        if _SENTENCE_END.search(buffer):
+            return len(buffer)
+        words = len(buffer.split())
+        if words >= SENTENCE_MIN_CLAUSE_WORDS and "," in buffer:
+            return buffer.rindex(",") + 1
+        if words > SENTENCE_MAX_WORDS:
+            # Don't cut a word that is still streaming in
+            return max(buffer.rfind(" "), 0)
+        return 0
+
+    async def _flush(self, end: int):
+        text, self._buffer = self._buffer[:end], self._buffer[end:]
+        if text.strip():
+            await self.push_frame(LLMTextFrame(text))
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartInterruptionFrame):
+            self._buffer = ""
+        elif direction == FrameDirection.DOWNSTREAM and isinstance(frame, LLMTextFrame):
+            self._buffer += frame.text
+            end = self._split_point()
+            if end:
+                await self._flush(end)
+            return
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            await self._flush(len(self._buffer))
+
+        await self.push_frame(frame, direction)
+
+
+class FillerProcessor(FrameProcessor):
+    """
+    Placed after the LLM; speaks a short filler phrase if the LLM hasn't
+    produced any output FILLER_DELAY seconds after the user's turn ended,
+    to mask LLM time-to-first-token.
+
+    The timer is stopped by the first text or function-call frame, not by
+    LLMFullResponseStartFrame, which the LLM pushes before its request has
+    returned anything.
+    """
+
+    def __init__(self, phrases=None, delay: float = FILLER_DELAY, **kwargs):
+        super().__init__(**kwargs)
+        self._phrases = phrases or FILLER_PHRASES
+        self._delay = delay
+        self._filler_task: Optional[asyncio.Task] = None
+
+    async def _cancel_filler(self):
+        if self._filler_task is not None:
+            task, self._filler_task = self._filler_task, None
+            await self.cancel_task(task)
+
+    async def _speak_filler(self):
+        await asyncio.sleep(self._delay)
+        self._filler_task = None
+        await self.push_frame(TTSSpeakFrame(random.choice(self._phrases)))
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, UserStoppedSpeakingFrame):
+            await self._cancel_filler()
+            self._filler_task = self.create_task(self._speak_filler())
+        elif isinstance(
+            frame,
+            (*_LLM_OUTPUT_FRAMES, UserStartedSpeakingFrame, StartInterruptionFrame),
+        ):
+            await self._cancel_filler()
+
+        await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        await self._cancel_filler()
@@ -1,5 +1,8 @@
+import hashlib
 import os
-from typing import Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -8,14 +11,19 @@ from datetime import datetime
 from pathlib import Path
 import asyncio
 
-from pipecat.services.google.stt import GoogleSTTService, Language
 from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
 from pipecat.services.google.llm import GoogleLLMService
 from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
 from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import LLMRunFrame, StartFrame, TextFrame
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    LLMMessagesAppendFrame,
+    LLMRunFrame,
+    TTSSpeakFrame,
+)
+from pipecat.pipeline.parallel_pipeline import ParallelPipeline
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -25,8 +33,7 @@ from pipecat.processors.aggregators.llm_response_universal import (
 )
 from pipecat.runner.types import RunnerArguments
 from pipecat.runner.utils import create_transport
-from pipecat.services.cartesia.tts import CartesiaTTSService
-from pipecat.services.deepgram.stt import DeepgramSTTService, Language, LiveOptions
+from pipecat.services.deepgram.stt import DeepgramSTTService, LiveOptions
 from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.services.simli.video import SimliVideoService
 from pipecat.transports.base_transport import BaseTransport, TransportParams
@@ -39,25 +46,36 @@ try:
 except ImportError:
     DAILY_AVAILABLE = False
     DailyParams = None
-from pipecat.frames.frames import EndFrame, EndTaskFrame, TTSSpeakFrame, TextFrame
-from pipecat.processors.frame_processor import FrameDirection
-from pipecat.services.llm_service import FunctionCallParams
-from pipecat.adapters.schemas.tools_schema import ToolsSchema
-from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.processors.transcript_processor import TranscriptProcessor
 # from pipecat.services.whisper.stt import WhisperSTTService  # Removed - not used, pulls in CUDA
 
 
 # Import Supabase client from context service
-from ..context_service.client import SupabaseClient, get_supabase_client
-from ..context_service.services import QueueService, TranscriptService
+from ..context_service.client import get_supabase_client
+from ..context_service.services import TranscriptService, get_queue_service
 from ..context_service.models import InterviewContext
+from ..config import InterviewConfig
+from .llm import CachedGoogleLLMService
+from .processors import (
+    FillerProcessor,
+    LLMRace,
+    LLMRaceProcessor,
+    SentenceAggregator,
+    SpeculativeLLM,
+)
+from .vad import EnergyGatedSileroVAD
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 # Import interview tools
 from ..tools import (
     clean_context_and_summarize,
     end_conversation,
     get_interview_tools_schema,
+    prefetch_farewell_audio,
     set_context_aggregator,
 )
 
@@ -69,51 +87,247 @@ _client = None
 load_dotenv(override=True)
 
 TRANSCRIPT_BASE_DIR = Path("storage")
+TRANSCRIPT_BASE_DIR.mkdir(parents=True, exist_ok=True)
+# Longest wait for TTS to stop gracefully at shutdown before cancelling it (seconds)
+TTS_STOP_TIMEOUT = 0.5
+# Coalescing window for transcript file writes (seconds)
+TRANSCRIPT_FLUSH_DELAY = 0.25
+# Display names for transcript roles (unknown roles fall back to capitalize())
+ROLE_MAP = {"user": "User", "assistant": "Assistant", "system": "System"}
+# Race a second LLM against Gemini and keep whichever answers first (opt-in)
+LLM_HEDGING = os.getenv("LLM_HEDGING", "0") == "1" and bool(os.getenv("OPENAI_API_KEY"))
+LLM_HEDGE_MODEL = os.getenv("LLM_HEDGE_MODEL", "gpt-4o-mini")
+# Start LLM inference on final STT segments before end-of-turn is confirmed (opt-in)
+SPECULATIVE_LLM = os.getenv("SPECULATIVE_LLM", "0") == "1"
+# Speak a short filler phrase while waiting on the LLM's first token (opt-in)
+FILLER_ENABLED = os.getenv("FILLER_ENABLED", "0") == "1"
+# Simli avatar video; disable for audio-only clients
+VIDEO_ENABLED = os.getenv("VIDEO_ENABLED", "1") == "1"
+# How long a generated opening greeting is reused for the same system prompt (seconds)
+GREETING_CACHE_TTL = 86400
+# How long a fetched interview context is reused for the same auth token (seconds)
+INTERVIEW_CONTEXT_TTL = 60.0
 # Hardcoded auth token for testing
 TEST_AUTH_TOKEN = "cac3c4ec-0542-4c3c-b6c1-3e3636fbb89a"
 _shutdown_services_callback = None
+# AUTH_TOKEN is set in the bot process's environment at launch
+_ENV_AUTH_TOKEN = os.getenv("AUTH_TOKEN")
+
+
+def _resolve_auth_token(transport: BaseTransport) -> str:
+    """AUTH_TOKEN, else the last path segment of the transport's room URL, else TEST_AUTH_TOKEN"""
+    if _ENV_AUTH_TOKEN:
+        return _ENV_AUTH_TOKEN
+    room_url = getattr(transport, "room_url", None)
+    return (room_url and room_url.rpartition("/")[2]) or TEST_AUTH_TOKEN
+
 
-# We store functions so objects (e.g. SileroVADAnalyzer) don't get
+# We store functions so objects (e.g. EnergyGatedSileroVAD) don't get
 # instantiated. The function will be called when the desired transport gets
 # selected.
 
 
 # Get interview tools schema
 tools = get_interview_tools_schema()
+# Gemini's function declarations for the schema, converted once per process;
+# the adapter passes non-ToolsSchema tools through unchanged
+google_tools = GoogleLLMService.adapter_class().to_provider_tools_format(tools)
+
+
+# Analyzers keep per-stream state (VAD model state and noise floor, audio and
+# turn buffers), so every transport gets its own: the pipecat dev runner serves
+# all connections from one process. The warm-up thread builds one of each ahead
+# of time (loading onnxruntime and the model files) and the first transport
+# takes them, so the usual one-interview-per-process bot doesn't load the models
+# when the candidate connects.
+_analyzer_lock = threading.Lock()
+_spare_vad = None
+_spare_turn = None
+
+
+def _new_vad_analyzer() -> EnergyGatedSileroVAD:
+    return EnergyGatedSileroVAD(params=VADParams(stop_secs=0.2))
+
+
+def _new_turn_analyzer() -> LocalSmartTurnAnalyzerV3:
+    return LocalSmartTurnAnalyzerV3(params=SmartTurnParams())
+
+
+def _vad_analyzer() -> EnergyGatedSileroVAD:
+    """A VAD analyzer for one transport (the pre-built one if still unused)"""
+    global _spare_vad
+    with _analyzer_lock:
+        vad, _spare_vad = _spare_vad, None
+    return vad or _new_vad_analyzer()
+
+
+def _turn_analyzer() -> LocalSmartTurnAnalyzerV3:
+    """A turn analyzer for one transport (the pre-built one if still unused)"""
+    global _spare_turn
+    with _analyzer_lock:
+        turn, _spare_turn = _spare_turn, None
+    return turn or _new_turn_analyzer()
+
+
+def _warm_analyzers():
+    global _spare_vad, _spare_turn
+    try:
+        vad = _new_vad_analyzer()
+        turn = _new_turn_analyzer()
+    except Exception:
+        logger.exception("Failed to pre-load VAD/turn analyzers")
+        return
+    with _analyzer_lock:
+        _spare_vad, _spare_turn = vad, turn
+
+
+# Load the models in the background so the first bot start doesn't wait on them
+threading.Thread(target=_warm_analyzers, name="analyzer-warmup", daemon=True).start()
+
+
+def _common_transport_kwargs() -> dict:
+    """Settings shared by every transport (each call gets its own analyzers)"""
+    return dict(
+        audio_in_enabled=True,
+        audio_out_enabled=True,
+        # Send outbound audio in 10ms chunks so the first bytes leave without
+        # waiting for a larger chunk to fill
+        audio_out_10ms_chunks=1,
+        video_out_enabled=VIDEO_ENABLED,
+        video_out_is_live=VIDEO_ENABLED,
+        video_out_width=512,
+        video_out_height=512,
+        vad_analyzer=_vad_analyzer(),
+        turn_analyzer=_turn_analyzer(),
+    )
 
 
 transport_params = {}
 
 # Always include WebRTC transport
 transport_params["webrtc"] = lambda: TransportParams(
-    audio_in_enabled=True,
-    audio_out_enabled=True,
-    video_out_enabled=True,
-    video_out_is_live=True,
-    video_out_width=512,
-    video_out_height=512,
-    vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-    turn_analyzer=LocalSmartTurnAnalyzerV3(params=SmartTurnParams()),
+    **_common_transport_kwargs(),
     data_channels_enabled=True,
 )
 
 # Add Daily transport only if available
 if DAILY_AVAILABLE:
-    transport_params["daily"] = lambda: DailyParams(
-        audio_in_enabled=True,
-        audio_out_enabled=True,
-        video_out_enabled=True,
-        video_out_is_live=True,
-        video_out_width=512,
-        video_out_height=512,
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-        turn_analyzer=LocalSmartTurnAnalyzerV3(params=SmartTurnParams()),
-    )
+    transport_params["daily"] = lambda: DailyParams(**_common_transport_kwargs())
 
 # For API-launched bots, force WebRTC transport
 if os.getenv("TRANSPORT") == "webrtc":
     transport_params = {"webrtc": transport_params["webrtc"]}
 
+# Second (epoch) and its formatted local "YYYY-MM-DDTHH:MM:SS" for _iso_now
+_iso_second = None
+_iso_prefix = ""
+
+
+def _iso_now() -> str:
+    """datetime.now().isoformat() equivalent, formatting the date/time part once per second"""
+    global _iso_second, _iso_prefix
+    now = time.time()
+    second = int(now)
+    if second != _iso_second:
+        _iso_second = second
+        _iso_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+    return f"{_iso_prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+_redis = None
+
+
+def _get_redis():
+    """Get the shared Redis client, or None when Redis is not configured"""
+    global _redis
+    if _redis is None and aioredis is not None and os.getenv("REDIS_URL"):
+        _redis = aioredis.from_url(os.getenv("REDIS_URL"), decode_responses=True)
+    return _redis
+
+
+def _greeting_key(system_prompt: str) -> str:
+    digest = hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=16)
+    return f"greeting:{digest.hexdigest()}"
+
+
+async def get_cached_greeting(system_prompt: str) -> Optional[str]:
+    """Opening greeting previously generated for system_prompt, if cached"""
+    redis_client = _get_redis()
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(_greeting_key(system_prompt))
+    except Exception as e:
+        logger.warning(f"Failed to read cached greeting: {e}")
+        return None
+
+
+async def cache_greeting(system_prompt: str, greeting: str):
+    """Store the opening greeting generated for system_prompt"""
+    redis_client = _get_redis()
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(
+            _greeting_key(system_prompt), GREETING_CACHE_TTL, greeting
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache greeting: {e}")
+
+
+# auth_token -> (fetched_at, InterviewContext, formatted system prompt), oldest first
+_interview_context_cache: Dict[str, Tuple[float, InterviewContext, str]] = {}
+# auth_token -> [lock, number of callers holding or waiting on it]
+_interview_context_locks: Dict[str, List] = {}
+
+
+def _store_interview_context(
+    auth_token: str, interview_context: InterviewContext, full_system_prompt: str
+):
+    """Cache a fetched context, evicting entries that have expired"""
+    now = time.monotonic()
+    _interview_context_cache.pop(auth_token, None)
+    # Entries are kept in fetch order, so the expired ones are at the front
+    while _interview_context_cache:
+        token, (fetched_at, _, _) = next(iter(_interview_context_cache.items()))
+        if now - fetched_at < INTERVIEW_CONTEXT_TTL:
+            break
+        del _interview_context_cache[token]
+    _interview_context_cache[auth_token] = (now, interview_context, full_system_prompt)
+
+
+async def get_cached_interview_context(
+    auth_token: str,
+) -> Optional[Tuple[InterviewContext, str]]:
+    """
+    Interview context and formatted system prompt for auth_token, reused for
+    INTERVIEW_CONTEXT_TTL seconds so reconnects skip the Supabase fetch.
+    Concurrent misses for the same token share one fetch.
+    """
+    entry = _interview_context_locks.setdefault(auth_token, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            cached = _interview_context_cache.get(auth_token)
+            if cached and time.monotonic() - cached[0] < INTERVIEW_CONTEXT_TTL:
+                return cached[1], cached[2]
+
+            record = await get_queue_service().get_interview_context_from_queue(
+                auth_token
+            )
+            if not record:
+                return None
+
+            interview_context = InterviewContext.from_supabase_record(record)
+            full_system_prompt = interview_context.format_full_context()
+            _store_interview_context(auth_token, interview_context, full_system_prompt)
+            return interview_context, full_system_prompt
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            # Nobody holds or waits on the lock any more
+            del _interview_context_locks[auth_token]
+
 
 async def run_bot(
     transport: BaseTransport,
@@ -124,74 +338,98 @@ async def run_bot(
 
     # Use provided auth_token or extract from environment variable (for API-launched bots) or room URL
     if auth_token is None:
-        auth_token = (
-            os.getenv("AUTH_TOKEN")
-            or (
-                getattr(transport, "room_url", "").split("/")[-1]
-                if hasattr(transport, "room_url")
-                else None
-            )
-            or TEST_AUTH_TOKEN
-        )
+        auth_token = _resolve_auth_token(transport)
 
     logger.info(f"Using auth_token: {auth_token}")
 
-    # Retrieve interview context from Supabase using auth_token
-    queue_service = QueueService()
-    interviewer_record = await queue_service.get_interview_context_from_queue(
-        auth_token
-    )
-
-    if not interviewer_record:
-        logger.error("Failed to retrieve interviewer record from queue")
-        # Handle error case - perhaps use default context or abort
-        return
-
-    # Create InterviewContext from the record
-    interview_context = InterviewContext.from_supabase_record(interviewer_record)
-
-    logger.info(
-        f"Retrieved interview context for {interview_context.candidate_name} applying for {interview_context.job_title} (ID: {interview_context.interview_id})"
+    # Retrieve interview context from Supabase using auth_token; the request
+    # runs while the (I/O-free) services below are constructed
+    interview_context_task = asyncio.create_task(
+        get_cached_interview_context(auth_token)
     )
+    # Let the lookup send its request before the synchronous work below
+    await asyncio.sleep(0)
 
     stt = DeepgramSTTService(
-        api_key=os.getenv("DEEPGRAM_API_KEY"),
+        api_key=InterviewConfig.DEEPGRAM_API_KEY,
         live_options=LiveOptions(
             model="nova-3",
+            interim_results=True,
+            punctuate=True,
+            smart_format=True,
+            # Finalize segments after 200ms of silence (SpeculativeLLM starts on these)
+            endpointing=200,
+            utterance_end_ms=1000,
         ),
     )
 
     tts = ElevenLabsTTSService(
-        api_key=os.getenv("ELEVENLABS_API_KEY", ""),
-        voice_id=os.getenv("ELEVENLABS_VOICE_ID", ""),
+        api_key=InterviewConfig.ELEVENLABS_API_KEY or "",
+        voice_id=InterviewConfig.ELEVENLABS_VOICE_ID,
+        model="eleven_flash_v2_5",
+        # PCM at 24kHz: Simli and the transport consume raw audio, so a
+        # compressed format would only add a decode step
+        sample_rate=24000,
+        # Sentences are already grouped by SentenceAggregator
+        aggregate_sentences=False,
+    )
+    # Synthesize the goodbye in the background so end_conversation can play it
+    # without a TTS round trip
+    farewell_task = asyncio.create_task(
+        prefetch_farewell_audio(
+            InterviewConfig.ELEVENLABS_API_KEY or "", InterviewConfig.ELEVENLABS_VOICE_ID
+        )
     )
 
-    simli_ai = SimliVideoService(
-        SimliConfig(os.getenv("SIMLI_API_KEY"), 
-                    os.getenv("SIMLI_FACE_ID")),
+    simli_ai = (
+        SimliVideoService(
+            SimliConfig(InterviewConfig.SIMLI_API_KEY, InterviewConfig.SIMLI_FACE_ID),
+        )
+        if VIDEO_ENABLED
+        else None
     )
-    # simli_ai = None  # Placeholder for now
 
-    llm = GoogleLLMService(
-        api_key=os.getenv("GOOGLE_API_KEY"),
+    llm = CachedGoogleLLMService(
+        api_key=InterviewConfig.GOOGLE_API_KEY,
         model="gemini-2.5-flash",
     )
 
-    # Register both tools
-    llm.register_function(
-        "clean_context_and_summarize",
-        clean_context_and_summarize,
-        cancel_on_interruption=True,
-    )
+    if LLM_HEDGING:
+        hedge_llm = OpenAILLMService(
+            api_key=InterviewConfig.OPENAI_API_KEY,
+            model=LLM_HEDGE_MODEL,
+        )
+        race = LLMRace()
+        llm_stage = ParallelPipeline(
+            [llm, LLMRaceProcessor(race, llm)],
+            [hedge_llm, LLMRaceProcessor(race, hedge_llm)],
+        )
+        llm_services = [llm, hedge_llm]
+    else:
+        race = None
+        llm_stage = llm
+        llm_services = [llm]
+
+    cached_context = await interview_context_task
+
+    if not cached_context:
+        logger.error("Failed to retrieve interviewer record from queue")
+        # Handle error case - perhaps use default context or abort
+        farewell_task.cancel()
+        return
 
-    llm.register_function(
-        "end_conversation",
-        end_conversation,
-        cancel_on_interruption=True,
+    # InterviewContext and its formatted system prompt
+    interview_context, full_system_prompt = cached_context
+
+    logger.info(
+        f"Retrieved interview context for {interview_context.candidate_name} applying for {interview_context.job_title} (ID: {interview_context.interview_id})"
     )
 
-    # Get the formatted context using InterviewContext
-    full_system_prompt = interview_context.format_full_context()
+    # The system prompt is static for the session; upload it to Gemini's
+    # context cache in the background (turns before it's ready send it inline)
+    context_cache_task = asyncio.create_task(
+        llm.create_context_cache(full_system_prompt, google_tools)
+    )
 
     # Enhanced system prompt with context management instructions
     messages = [
@@ -201,28 +439,105 @@ async def run_bot(
         },
     ]
 
-    context = LLMContext(messages, tools=tools)
+    # A hedged OpenAI branch needs the provider-neutral schema
+    context = LLMContext(messages, tools=tools if LLM_HEDGING else google_tools)
     context_aggregator = LLMContextAggregatorPair(context)
 
     # Store global reference for tool access
-    set_context_aggregator(context_aggregator)
+    set_context_aggregator(context_aggregator, initial_system_msg=messages[0])
+
+    speculative_llm = (
+        SpeculativeLLM(llm_stage, context, llm_services) if SPECULATIVE_LLM else None
+    )
+
+    def guarded(handler):
+        # When racing only the winner's call runs; a speculative run's call
+        # only runs once the run is committed
+        if race:
+            handler = race.guard(handler)
+        if speculative_llm:
+            handler = speculative_llm.guard(handler)
+        return handler
+
+    # Register both tools on every LLM
+    for llm_service in llm_services:
+        llm_service.register_function(
+            "clean_context_and_summarize",
+            guarded(clean_context_and_summarize),
+            cancel_on_interruption=True,
+        )
+
+        llm_service.register_function(
+            "end_conversation",
+            guarded(end_conversation),
+            cancel_on_interruption=True,
+        )
 
     transcript = TranscriptProcessor()
     session_timestamp = datetime.now()
-    session_transcript_dir = TRANSCRIPT_BASE_DIR
-    transcript_path = (
-        session_transcript_dir / f"interview-{interview_context.interview_id}.md"
+    transcript_path = str(
+        TRANSCRIPT_BASE_DIR / f"interview-{interview_context.interview_id}.md"
     )
     transcript_initialized = False
-    services_shutdown = False
-
-    async def shutdown_services():
-        nonlocal services_shutdown
-        if services_shutdown:
-            return
-        services_shutdown = True
+    # Set while the LLM generates the opening greeting, so it can be cached
+    greeting_pending = False
+    # Set when shutdown begins / once it has finished, so concurrent callers
+    # wait for the in-flight shutdown instead of returning early
+    shutdown_started = asyncio.Event()
+    shutdown_done = asyncio.Event()
+
+    # Transcript chunks are written by a single background task (in a worker
+    # thread) so disk I/O never blocks the audio pipeline's event loop
+    transcript_queue: asyncio.Queue = asyncio.Queue()
+    # Everything queued for the file is also kept here, so the upload at
+    # shutdown doesn't have to read the file back
+    transcript_buffer: list[str] = []
+    # Opened once on the first write and kept open for the whole session
+    transcript_fd: Optional[int] = None
+
+    def write_transcript_chunks(chunks: list[str]):
+        nonlocal transcript_fd
+        if transcript_fd is None:
+            transcript_fd = os.open(
+                transcript_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND,
+                0o644,
+            )
+        # One writev for the whole batch; finish with os.write on a short write
+        encoded = [chunk.encode("utf-8") for chunk in chunks]
+        written = os.writev(transcript_fd, encoded)
+        if written < sum(map(len, encoded)):
+            data = memoryview(b"".join(encoded))[written:]
+            while data:
+                data = data[os.write(transcript_fd, data):]
+
+    async def transcript_writer():
+        while True:
+            chunks = [await transcript_queue.get()]
+            # Let a burst of updates accumulate, then write it all at once
+            await asyncio.sleep(TRANSCRIPT_FLUSH_DELAY)
+            while not transcript_queue.empty():
+                chunks.append(transcript_queue.get_nowait())
+            try:
+                await asyncio.to_thread(write_transcript_chunks, chunks)
+            except Exception:
+                logger.exception("Failed to write transcript file")
+            finally:
+                for _ in chunks:
+                    transcript_queue.task_done()
+
+    transcript_writer_task = asyncio.create_task(transcript_writer())
+
+    async def stop_tts():
         try:
-            await tts.stop(EndFrame())
+            # Don't let a mid-synthesis ElevenLabs stream hold up shutdown
+            await asyncio.wait_for(tts.stop(EndFrame()), timeout=TTS_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("ElevenLabs TTS did not stop in time, cancelling it")
+            try:
+                await tts.cancel(CancelFrame())
+            except Exception:
+                logger.exception("Failed to cancel ElevenLabs TTS service")
         except Exception:
             logger.exception("Failed to stop ElevenLabs TTS service")
         try:
@@ -230,67 +545,94 @@ async def run_bot(
         except Exception:
             logger.exception("Failed to clean up ElevenLabs TTS service")
 
+    async def save_transcript():
         # Save transcript to Supabase when interview ends
         transcript_service = TranscriptService()
 
+        if not transcript_buffer:
+            logger.error(f"No transcript recorded for {transcript_path}")
+        else:
+            try:
+                full_text = "".join(transcript_buffer)
+
+                # Create transcript_json with interview metadata
+                transcript_json = {
+                    "interview_id": interview_context.interview_id,
+                    "candidate_name": interview_context.candidate_name,
+                    "job_title": interview_context.job_title,
+                    "questions_asked": len(interview_context.questions),
+                    "transcript_length": len(full_text),
+                    "session_timestamp": session_timestamp.isoformat(),
+                }
+
+                success = await transcript_service.write_transcript(
+                    interview_id=interview_context.interview_id,
+                    full_text=full_text,
+                    transcript_json=transcript_json,
+                )
+
+                if success:
+                    logger.info(
+                        f"Transcript saved to Supabase for interview {interview_context.interview_id}"
+                    )
+                else:
+                    logger.error(
+                        f"Failed to save transcript to Supabase for interview {interview_context.interview_id}"
+                    )
+
+            except Exception as e:
+                logger.error(f"Error saving transcript: {e}")
+
+    async def shutdown_services():
+        if shutdown_started.is_set():
+            await shutdown_done.wait()
+            return
+        shutdown_started.set()
         try:
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                full_text = f.read()
-
-            # Create transcript_json with interview metadata
-            transcript_json = {
-                "interview_id": interview_context.interview_id,
-                "candidate_name": interview_context.candidate_name,
-                "job_title": interview_context.job_title,
-                "questions_asked": len(interview_context.questions),
-                "transcript_length": len(full_text),
-                "session_timestamp": session_timestamp.isoformat(),
-            }
-
-            success = await transcript_service.write_transcript(
-                interview_id=interview_context.interview_id,
-                full_text=full_text,
-                transcript_json=transcript_json,
-            )
+            # Too late to use the farewell audio if it is still being synthesized
+            farewell_task.cancel()
 
-            if success:
-                logger.info(
-                    f"Transcript saved to Supabase for interview {interview_context.interview_id}"
-                )
-            else:
-                logger.error(
-                    f"Failed to save transcript to Supabase for interview {interview_context.interview_id}"
-                )
+            # TTS teardown and the transcript upload are independent
+            await asyncio.gather(stop_tts(), save_transcript())
+
+            # The markdown file is a side artifact; finish it after the upload
+            await transcript_queue.join()
+            transcript_writer_task.cancel()
+            if transcript_fd is not None:
+                os.close(transcript_fd)
 
-        except FileNotFoundError:
-            logger.error(f"Transcript file not found: {transcript_path}")
-        except Exception as e:
-            logger.error(f"Error saving transcript: {e}")
+            # Drop the session's cached system prompt (waiting for an in-flight upload)
+            await context_cache_task
+            await llm.delete_context_cache()
+        finally:
+            shutdown_done.set()
 
     global _shutdown_services_callback
     _shutdown_services_callback = shutdown_services
 
-    # Build pipeline conditionally
+    # Build the pipeline in one pass; optional stages are None when disabled
     pipeline_components = [
-        transport.input(),
-        stt,
-        transcript.user(),
-        context_aggregator.user(),
-        llm,
-        tts,
-    ]
-
-    # Add video service if available
-    if simli_ai:
-        pipeline_components.append(simli_ai)
-
-    pipeline_components.extend(
-        [
+        stage
+        for stage in (
+            transport.input(),
+            stt,
+            speculative_llm.listener() if speculative_llm else None,
+            transcript.user(),
+            context_aggregator.user(),
+            speculative_llm.gate() if speculative_llm else None,
+            llm_stage,
+            speculative_llm.release() if speculative_llm else None,
+            # Filler phrases go to TTS ahead of the (still pending) LLM response
+            FillerProcessor() if FILLER_ENABLED else None,
+            SentenceAggregator(),
+            tts,
+            simli_ai,
             transport.output(),
             transcript.assistant(),
             context_aggregator.assistant(),
-        ]
-    )
+        )
+        if stage is not None
+    ]
 
     pipeline = Pipeline(pipeline_components)
 
@@ -305,8 +647,25 @@ async def run_bot(
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
         logger.info("Client connected, starting interview.")
-        # Send StartFrame to initialize the pipeline
-        await task.queue_frame(StartFrame())
+        # The services already connected on the task's own StartFrame when
+        # the runner started, so the first turn doesn't pay their handshakes.
+        nonlocal greeting_pending
+        cached_greeting = await get_cached_greeting(full_system_prompt)
+        if cached_greeting:
+            # Same prompt already produced an opening: speak it without an LLM
+            # round trip and record it in the context as the assistant's turn
+            logger.info("Using cached opening greeting")
+            await task.queue_frames(
+                [
+                    LLMMessagesAppendFrame(
+                        [{"role": "assistant", "content": cached_greeting}],
+                        run_llm=False,
+                    ),
+                    TTSSpeakFrame(cached_greeting),
+                ]
+            )
+            return
+        greeting_pending = True
         # Start conversation with LLM. The LLM will use the system prompt to begin.
         await task.queue_frame(LLMRunFrame())
 
@@ -318,29 +677,40 @@ async def run_bot(
 
     @transcript.event_handler("on_transcript_update")
     async def handle_transcript_update(processor, frame):
-        nonlocal transcript_initialized
+        nonlocal transcript_initialized, greeting_pending
         if not frame.messages:
             return
-        if not transcript_initialized:
-            session_transcript_dir.mkdir(parents=True, exist_ok=True)
-            with transcript_path.open("w", encoding="utf-8") as md_file:
-                md_file.write(
-                    f"# Interview Transcript - {session_timestamp:%Y-%m-%d %H:%M UTC}\n\n"
-                    f"**Interview ID:** `{interview_context.interview_id}`\n\n"
-                    "## Interview Context\n"
-                    f"- **Candidate:** {interview_context.candidate_name}\n"
-                    f"- **Position:** {interview_context.job_title}\n"
-                    f"- **Status:** In Progress\n\n"
+        if greeting_pending:
+            # Only an opening the assistant spoke first is cached for the next
+            # run of this prompt (not a reply to something the user said)
+            greeting_pending = False
+            if frame.messages[0].role == "assistant":
+                asyncio.create_task(
+                    cache_greeting(full_system_prompt, frame.messages[0].content)
                 )
-            transcript_initialized = True
         lines = []
+        # One fallback timestamp per frame rather than one per message
+        fallback_timestamp = _iso_now()
         for message in frame.messages:
-            role = message.role.capitalize()
-            timestamp = message.timestamp or datetime.now().isoformat()
+            role = ROLE_MAP.get(message.role) or message.role.capitalize()
+            timestamp = message.timestamp or fallback_timestamp
             content = message.content.strip().replace("\n", "  \n")
             lines.append(f"- **{timestamp} – {role}:** {content}")
-        with transcript_path.open("a", encoding="utf-8") as md_file:
-            md_file.write("\n".join(lines) + "\n")
+        text = "\n".join(lines) + "\n"
+        if not transcript_initialized:
+            # Header and first messages go out as one chunk (one write)
+            header = (
+                f"# Interview Transcript - {session_timestamp:%Y-%m-%d %H:%M UTC}\n\n"
+                f"**Interview ID:** `{interview_context.interview_id}`\n\n"
+                "## Interview Context\n"
+                f"- **Candidate:** {interview_context.candidate_name}\n"
+                f"- **Position:** {interview_context.job_title}\n"
+                f"- **Status:** In Progress\n\n"
+            )
+            text = header + text
+            transcript_initialized = True
+        transcript_buffer.append(text)
+        transcript_queue.put_nowait(text)
 
     runner = PipelineRunner(handle_sigint=runner_args.handle_sigint)
 
@@ -385,6 +755,10 @@ async def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        # Release pooled Supabase connections once the process is done with
+        # them (the client is shared by every session in the process)
+        await get_supabase_client().aclose()
 
 
 if __name__ == "__main__":
@@ -392,7 +766,17 @@ if __name__ == "__main__":
 
     # Check if running with auth_token argument (CLI mode)
     if len(sys.argv) >= 2 and not sys.argv[1].startswith("--"):
-        asyncio.run(main())
+        # uvloop (installed with uvicorn[standard]) speeds up the many small
+        # websocket reads/writes of the STT/LLM/TTS/Simli services
+        try:
+            import uvloop
+        except ImportError:
+            uvloop = None
+
+        if uvloop is not None and sys.platform != "win32":
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     else:
         # Pipecat Cloud mode
         from pipecat.runner.run import main
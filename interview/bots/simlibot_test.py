@@ -1,10 +1,10 @@
 import os
+import time
 from typing import Optional
 
 from dotenv import load_dotenv
 from loguru import logger
-from simli import SimliConfig
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 import asyncio
 
@@ -18,18 +18,11 @@ from pipecat.transports.base_transport import BaseTransport, TransportParams
 from pipecat.frames.frames import StartFrame
 from pipecat.processors.transcript_processor import TranscriptProcessor
 
-# VAD and Turn Taking
+# VAD and Turn Taking (the analyzers and the services, which pull in
+# onnxruntime, numpy and the vendor SDKs, are imported where first used)
 from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
 
-# Pipecat Services
-from pipecat.services.google.llm import GoogleLLMService
-from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
-from pipecat.services.deepgram.stt import DeepgramSTTService, LiveOptions
-from pipecat.services.simli.video import SimliVideoService
-
 # Try to import Daily transport
 try:
     from pipecat.transports.daily.transport import DailyParams
@@ -43,8 +36,9 @@ except ImportError:
 from pipecat_flows import FlowManager, FlowArgs, NodeConfig, FlowsFunctionSchema
 
 # Import application-specific context and services
-from ..context_service.services import QueueService, TranscriptService
+from ..context_service.services import TranscriptService, get_queue_service
 from ..context_service.models import InterviewContext
+from ..config import InterviewConfig
 
 # Singleton instance
 _client = None
@@ -52,33 +46,78 @@ _client = None
 load_dotenv(override=True)
 
 TRANSCRIPT_BASE_DIR = Path("storage")
+TRANSCRIPT_BASE_DIR.mkdir(parents=True, exist_ok=True)
+# Coalescing window for transcript file writes (seconds)
+TRANSCRIPT_FLUSH_DELAY = 0.25
 TEST_AUTH_TOKEN = "3ed18a89-7315-43af-a016-18692ba77571"
 _shutdown_services_callback = None
+# AUTH_TOKEN is set in the bot process's environment at launch
+_ENV_AUTH_TOKEN = os.getenv("AUTH_TOKEN")
 
-# Transport configurations (unchanged)
-transport_params = {}
-transport_params["webrtc"] = lambda: TransportParams(
-    audio_in_enabled=True,
-    audio_out_enabled=True,
-    video_out_enabled=True,
-    video_out_is_live=True,
-    video_out_width=512,
-    video_out_height=512,
-    vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-    turn_analyzer=LocalSmartTurnAnalyzerV3(params=SmartTurnParams()),
-    data_channels_enabled=True,
-)
-if DAILY_AVAILABLE:
-    transport_params["daily"] = lambda: DailyParams(
+
+def _resolve_auth_token(transport: BaseTransport) -> str:
+    """AUTH_TOKEN, else the last path segment of the transport's room URL, else TEST_AUTH_TOKEN"""
+    if _ENV_AUTH_TOKEN:
+        return _ENV_AUTH_TOKEN
+    room_url = getattr(transport, "room_url", None)
+    return (room_url and room_url.rpartition("/")[2]) or TEST_AUTH_TOKEN
+
+
+# Analyzers keep per-stream state (VAD model state and noise floor, audio and
+# turn buffers), so every transport gets its own; the pipecat dev runner serves
+# all connections from one process
+def _vad_analyzer():
+    from .vad import EnergyGatedSileroVAD
+
+    return EnergyGatedSileroVAD(params=VADParams(stop_secs=0.2))
+
+
+def _turn_analyzer():
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import (
+        LocalSmartTurnAnalyzerV3,
+    )
+
+    return LocalSmartTurnAnalyzerV3(params=SmartTurnParams())
+
+
+def _common_transport_kwargs() -> dict:
+    """Settings shared by every transport (each call gets its own analyzers)"""
+    return dict(
         audio_in_enabled=True,
         audio_out_enabled=True,
         video_out_enabled=True,
         video_out_is_live=True,
         video_out_width=512,
         video_out_height=512,
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-        turn_analyzer=LocalSmartTurnAnalyzerV3(params=SmartTurnParams()),
+        vad_analyzer=_vad_analyzer(),
+        turn_analyzer=_turn_analyzer(),
     )
+
+
+# Second (epoch) and its formatted UTC "YYYY-MM-DDTHH:MM:SS" for _utc_iso_now
+_iso_second = None
+_iso_prefix = ""
+
+
+def _utc_iso_now() -> str:
+    """datetime.now(timezone.utc).isoformat() equivalent, formatting the date/time part once per second"""
+    global _iso_second, _iso_prefix
+    now = time.time()
+    second = int(now)
+    if second != _iso_second:
+        _iso_second = second
+        _iso_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    return f"{_iso_prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
+
+# Transport configurations
+transport_params = {}
+transport_params["webrtc"] = lambda: TransportParams(
+    **_common_transport_kwargs(),
+    data_channels_enabled=True,
+)
+if DAILY_AVAILABLE:
+    transport_params["daily"] = lambda: DailyParams(**_common_transport_kwargs())
 if os.getenv("TRANSPORT") == "webrtc":
     transport_params = {"webrtc": transport_params["webrtc"]}
 
@@ -105,19 +144,18 @@ async def handle_summarize_and_next_question(
     flow_manager.state["summaries"].append(summary)
 
     current_question_pos = flow_manager.state.get("current_question_pos", 0)
-    interview_context: InterviewContext = flow_manager.state["interview_context"]
+    question_nodes = flow_manager.state["question_nodes"]
     next_question_pos = current_question_pos + 1
 
-    if next_question_pos < len(interview_context.questions):
+    if next_question_pos < len(question_nodes):
         # If there are more questions, transition to the next question node
         logger.info(f"Transitioning to question {next_question_pos + 1}")
-        next_node = create_question_node(
-            interview_context=interview_context, question_position=next_question_pos
-        )
+        flow_manager.state["current_question_pos"] = next_question_pos
+        next_node = question_nodes[next_question_pos]
     else:
         # If all questions are done, transition to the candidate questions node
         logger.info("All questions answered, transitioning to candidate questions.")
-        next_node = create_candidate_questions_node()
+        next_node = flow_manager.state["candidate_node"]
 
     return (
         f"Summary of question {current_question_pos + 1} has been processed.",
@@ -136,26 +174,45 @@ async def handle_end_conversation(
     return "The user is ready to end the call.", create_end_node()
 
 
+async def start_first_question(
+    args: FlowArgs, flow_manager: FlowManager
+) -> tuple[str, NodeConfig]:
+    """
+    This handler is called by the 'start_interview_questions' tool.
+    Its only job is to transition to the first question.
+    """
+    logger.info("Greeting complete, transitioning to first question.")
+    flow_manager.state["current_question_pos"] = 0
+    return "Greeting complete, beginning questions.", flow_manager.state["question_nodes"][0]
+
+
 # -- Schemas: Define the tools available to the LLM in different nodes --
 
-# summarize_schema = FlowsFunctionSchema(
-#     name="clean_context_and_summarize",
-#     description="Call after a question is sufficiently answered to clean context and store a summary.",
-#     handler=handle_summarize_and_next_question,
-#     properties={
-#         "summary": {
-#             "type": "string",
-#             "description": "A concise summary of the candidate's answer, capturing key evidence, strengths, and any flags.",
-#         }
-#     },
-#     required=["summary"],
-# )
-
-# end_conversation_schema = FlowsFunctionSchema(
-#     name="end_conversation",
-#     description="Call to end the session when the candidate has no more questions or requests to finish.",
-#     handler=handle_end_conversation,
-# )
+# A tool for the LLM to call to explicitly start the question phase.
+transition_to_first_question_schema = FlowsFunctionSchema(
+    name="start_interview_questions",
+    description="Call this function after delivering the greeting and the candidate is ready to begin.",
+    handler=start_first_question,
+)
+
+summarize_schema = FlowsFunctionSchema(
+    name="clean_context_and_summarize",
+    description="Call after a question is sufficiently answered to clean context and store a summary.",
+    handler=handle_summarize_and_next_question,
+    properties={
+        "summary": {
+            "type": "string",
+            "description": "A concise summary of the candidate's answer, capturing key evidence, strengths, and any flags.",
+        }
+    },
+    required=["summary"],
+)
+
+end_conversation_schema = FlowsFunctionSchema(
+    name="end_conversation",
+    description="Call to end the session when the candidate has no more questions or requests to finish.",
+    handler=handle_end_conversation,
+)
 
 
 # -- Node Creators: Functions that build the configuration for each conversational state --
@@ -210,31 +267,21 @@ def create_question_node(
     )
 
 
-def create_greeting_node(interview_context: InterviewContext) -> NodeConfig:
-    """Creates the initial greeting node that starts the interview flow."""
-
-    # This handler's only job is to transition to the first question.
-    async def start_first_question(
-        args: FlowArgs, flow_manager: FlowManager
-    ) -> tuple[str, NodeConfig]:
-        logger.info("Greeting complete, transitioning to first question.")
-        first_question_node = create_question_node(interview_context, 0)
-        return "Greeting complete, beginning questions.", first_question_node
-
-    # A tool for the LLM to call to explicitly start the question phase.
-    transition_to_first_question_schema = FlowsFunctionSchema(
-        name="start_interview_questions",
-        description="Call this function after delivering the greeting and the candidate is ready to begin.",
-        handler=start_first_question,
-    )
-
-    num_questions = len(interview_context.questions)
-    greeting_prompt = f"""
+GREETING_PROMPT = """
     You are Kathia Salazar, a voice interviewer for anyone AI.
-    Your first task is to greet the candidate, {interview_context.candidate_name}.
-    Set the expectations: there will be {num_questions} questions about the {interview_context.job_title} role.
+    Your first task is to greet the candidate, {candidate_name}.
+    Set the expectations: there will be {num_questions} questions about the {job_title} role.
     After the candidate confirms they are ready, you MUST call the 'start_interview_questions' function to proceed.
     """
+
+
+def create_greeting_node(interview_context: InterviewContext) -> NodeConfig:
+    """Creates the initial greeting node that starts the interview flow."""
+    greeting_prompt = GREETING_PROMPT.format(
+        candidate_name=interview_context.candidate_name,
+        num_questions=len(interview_context.questions),
+        job_title=interview_context.job_title,
+    )
     return NodeConfig(
         name="greeting",
         task_messages=[{"role": "system", "content": greeting_prompt}],
@@ -257,95 +304,128 @@ async def run_bot(
 
     # --- Context and Service Initialization (largely unchanged) ---
     if auth_token is None:
-        auth_token = (
-            os.getenv("AUTH_TOKEN")
-            or (
-                getattr(transport, "room_url", "").split("/")[-1]
-                if hasattr(transport, "room_url")
-                else None
-            )
-            or TEST_AUTH_TOKEN
-        )
+        auth_token = _resolve_auth_token(transport)
 
     logger.info(f"Using auth_token: {auth_token}")
 
-    queue_service = QueueService()
-    interviewer_record = await queue_service.get_interview_context_from_queue(
-        auth_token
+    # The queue lookup runs while the (I/O-free) services below are imported
+    # and constructed
+    interviewer_record_task = asyncio.create_task(
+        get_queue_service().get_interview_context_from_queue(auth_token)
     )
+    # Let the lookup send its request before the synchronous work below
+    await asyncio.sleep(0)
 
-    if not interviewer_record:
-        logger.error("Failed to retrieve interviewer record from queue")
-        return
-
-    interview_context = InterviewContext.from_supabase_record(interviewer_record)
-    logger.info(
-        f"Retrieved interview context for {interview_context.candidate_name} (ID: {interview_context.interview_id})"
-    )
+    from simli import SimliConfig
+    from pipecat.services.deepgram.stt import DeepgramSTTService, LiveOptions
+    from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
+    from pipecat.services.google.llm import GoogleLLMService
+    from pipecat.services.simli.video import SimliVideoService
 
     stt = DeepgramSTTService(
-        api_key=os.getenv("DEEPGRAM_API_KEY"),
+        api_key=InterviewConfig.DEEPGRAM_API_KEY,
         live_options=LiveOptions(model="nova-3"),
     )
     tts = ElevenLabsTTSService(
-        api_key=os.getenv("ELEVENLABS_API_KEY", ""),
-        voice_id=os.getenv("ELEVENLABS_VOICE_ID", ""),
+        api_key=InterviewConfig.ELEVENLABS_API_KEY or "",
+        voice_id=InterviewConfig.ELEVENLABS_VOICE_ID,
     )
     simli_ai = SimliVideoService(
-        SimliConfig(os.getenv("SIMLI_API_KEY"), os.getenv("SIMLI_FACE_ID")),
+        SimliConfig(InterviewConfig.SIMLI_API_KEY, InterviewConfig.SIMLI_FACE_ID),
     )
     llm = GoogleLLMService(
-        api_key=os.getenv("GOOGLE_API_KEY"),
+        api_key=InterviewConfig.GOOGLE_API_KEY,
         model="gemini-1.5-flash",
     )
 
+    interviewer_record = await interviewer_record_task
+
+    if not interviewer_record:
+        logger.error("Failed to retrieve interviewer record from queue")
+        return
+
+    interview_context = InterviewContext.from_supabase_record(interviewer_record)
+    logger.info(
+        f"Retrieved interview context for {interview_context.candidate_name} (ID: {interview_context.interview_id})"
+    )
+
     # --- Transcript and Shutdown Logic (unchanged) ---
     transcript = TranscriptProcessor()
-    session_timestamp = datetime.now(datetime.UTC)
+    session_timestamp = datetime.now(timezone.utc)
     transcript_path = (
         TRANSCRIPT_BASE_DIR / f"interview-{interview_context.interview_id}.md"
     )
     transcript_initialized = False
     services_shutdown = False
 
+    # Transcript chunks are written by a single background task (in a worker
+    # thread) so disk I/O never blocks the audio pipeline's event loop
+    transcript_queue: asyncio.Queue = asyncio.Queue()
+    # Everything queued for the file is also kept here for the upload
+    transcript_buffer: list[str] = []
+    # Opened once on the first write and kept open for the whole session
+    transcript_fd: Optional[int] = None
+
+    def write_transcript_chunks(chunks: list[str]):
+        nonlocal transcript_fd
+        if transcript_fd is None:
+            transcript_fd = os.open(
+                transcript_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND,
+                0o644,
+            )
+        # One writev for the whole batch; finish with os.write on a short write
+        encoded = [chunk.encode("utf-8") for chunk in chunks]
+        written = os.writev(transcript_fd, encoded)
+        if written < sum(map(len, encoded)):
+            data = memoryview(b"".join(encoded))[written:]
+            while data:
+                data = data[os.write(transcript_fd, data):]
+
+    async def transcript_writer():
+        while True:
+            chunks = [await transcript_queue.get()]
+            # Let a burst of updates accumulate, then write it all at once
+            await asyncio.sleep(TRANSCRIPT_FLUSH_DELAY)
+            while not transcript_queue.empty():
+                chunks.append(transcript_queue.get_nowait())
+            try:
+                await asyncio.to_thread(write_transcript_chunks, chunks)
+            except Exception:
+                logger.exception("Failed to write transcript file")
+            finally:
+                for _ in chunks:
+                    transcript_queue.task_done()
+
+    transcript_writer_task = asyncio.create_task(transcript_writer())
+
+    async def stop_and_clean(service, name: str):
+        logger.info(f"Shutting down {name} service.")
+        try:
+            await service.stop()
+            await service.cleanup()
+        except Exception as e:
+            logger.exception(f"Failed to stop or clean up {name} service: {e}")
+
     async def shutdown_services():
         nonlocal services_shutdown
         if services_shutdown:
             return
         services_shutdown = True
-        logger.info("Shutting down STT service.")
-        try:
-            await stt.stop()
-            await stt.cleanup()
-        except Exception as e:
-            logger.exception(f"Failed to stop or clean up STT service: {e}")
-
-        logger.info("Shutting down LLM service.")
-        try:
-            await llm.stop()
-            await llm.cleanup()
-        except Exception as e:
-            logger.exception(f"Failed to stop or clean up LLM service: {e}")
-
-        logger.info("Shutting down Simli AI service.")
-        try:
-            await simli_ai.stop()
-            await simli_ai.cleanup()
-        except Exception as e:
-            logger.exception(f"Failed to stop or clean up Simli AI service: {e}")
-
-        logger.info("Shutting down TTS service.")
-        try:
-            await tts.stop()
-            await tts.cleanup()
-        except Exception as e:
-            logger.exception(f"Failed to stop or clean up TTS service: {e}")
+        # The services' teardowns are independent network closes
+        await asyncio.gather(
+            stop_and_clean(stt, "STT"),
+            stop_and_clean(llm, "LLM"),
+            stop_and_clean(simli_ai, "Simli AI"),
+            stop_and_clean(tts, "TTS"),
+        )
 
         logger.info("Saving transcript to Supabase.")
         transcript_service = TranscriptService()
         try:
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                full_text = f.read()
+            if not transcript_buffer:
+                raise FileNotFoundError(transcript_path)
+            full_text = "".join(transcript_buffer)
             transcript_json = {
                 "interview_id": interview_context.interview_id,
                 "candidate_name": interview_context.candidate_name,
@@ -368,10 +448,16 @@ async def run_bot(
                     f"Failed to save transcript to Supabase for interview {interview_context.interview_id}"
                 )
         except FileNotFoundError:
-            logger.error(f"Transcript file not found: {transcript_path}")
+            logger.error(f"No transcript recorded for {transcript_path}")
         except Exception as e:
             logger.error(f"Error saving transcript: {e}")
 
+        # The markdown file is a side artifact; finish it after the upload
+        await transcript_queue.join()
+        transcript_writer_task.cancel()
+        if transcript_fd is not None:
+            os.close(transcript_fd)
+
     global _shutdown_services_callback
     _shutdown_services_callback = shutdown_services
 
@@ -382,6 +468,12 @@ async def run_bot(
 
     # Store the interview context in the flow's state so handlers can access it.
     flow_manager.state["interview_context"] = interview_context
+    # The question list is known up front, so every node is built once here
+    flow_manager.state["question_nodes"] = tuple(
+        create_question_node(interview_context, i)
+        for i in range(len(interview_context.questions))
+    )
+    flow_manager.state["candidate_node"] = create_candidate_questions_node()
 
     pipeline_components = [
         transport.input(),
@@ -431,27 +523,30 @@ async def run_bot(
         nonlocal transcript_initialized
         if not frame.messages:
             return
-        if not transcript_initialized:
-            TRANSCRIPT_BASE_DIR.mkdir(parents=True, exist_ok=True)
-            with transcript_path.open("w", encoding="utf-8") as md_file:
-                md_file.write(
-                    f"# Interview Transcript - {session_timestamp:%Y-%m-%d %H:%M UTC}\n\n"
-                    f"**Interview ID:** `{interview_context.interview_id}`\n\n"
-                    "## Interview Context\n"
-                    f"- **Candidate:** {interview_context.candidate_name}\n"
-                    f"- **Position:** {interview_context.job_title}\n"
-                    f"- **Status:** In Progress\n\n"
-                    "## Transcript\n"
-                )
-            transcript_initialized = True
+        # One fallback timestamp per frame rather than one per message
+        fallback_timestamp = _utc_iso_now()
         lines = []
         for message in frame.messages:
             role = "Interviewer" if message.role == "assistant" else "Candidate"
-            timestamp = message.timestamp or datetime.now(datetime.UTC).isoformat()
+            timestamp = message.timestamp or fallback_timestamp
             content = message.content.strip().replace("\n", "  \n")
             lines.append(f"- **{timestamp} – {role}:** {content}")
-        with transcript_path.open("a", encoding="utf-8") as md_file:
-            md_file.write("\n".join(lines) + "\n")
+        text = "\n".join(lines) + "\n"
+        if not transcript_initialized:
+            # Header and first messages go out as one chunk (one write)
+            header = (
+                f"# Interview Transcript - {session_timestamp:%Y-%m-%d %H:%M UTC}\n\n"
+                f"**Interview ID:** `{interview_context.interview_id}`\n\n"
+                "## Interview Context\n"
+                f"- **Candidate:** {interview_context.candidate_name}\n"
+                f"- **Position:** {interview_context.job_title}\n"
+                f"- **Status:** In Progress\n\n"
+                "## Transcript\n"
+            )
+            text = header + text
+            transcript_initialized = True
+        transcript_buffer.append(text)
+        transcript_queue.put_nowait(text)
 
     # --- Run the Pipeline ---
     runner = PipelineRunner(handle_sigint=runner_args.handle_sigint)
@@ -0,0 +1,81 @@
+"""
+Voice activity detection for the interview bots
+"""
+
+import math
+
+import numpy as np
+
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+# Number of log-spaced frequency bands used by the energy pre-filter
+ENERGY_BANDS = 8
+# Speech band covered by the pre-filter (Hz)
+ENERGY_MIN_HZ = 100.0
+ENERGY_MAX_HZ = 4000.0
+# Noise-floor EMA rate, applied on confirmed silence only
+NOISE_FLOOR_ALPHA = 0.01
+# A band must rise this many dB above its noise floor to count as possible speech
+ENERGY_MARGIN_DB = 6.0
+# Silero confidence below which a frame counts as confirmed silence
+SILENCE_CONFIDENCE = 0.1
+
+
+class EnergyGatedSileroVAD(SileroVADAnalyzer):
+    """
+    SileroVADAnalyzer with a cheap spectral-energy pre-filter.
+
+    Each frame is split into 8 log-spaced bands; if no band rises more than
+    ENERGY_MARGIN_DB above its adaptive noise floor the frame is reported as
+    silence without running the Silero model. The floor starts very low, so
+    every frame goes to Silero until enough silence has been observed.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Compare in the natural-log energy domain: no per-frame log10/exp needed
+        self._margin = ENERGY_MARGIN_DB * math.log(10) / 10
+        self._noise_floor = None
+        self._band_edges = None
+        self._band_key = None
+
+    def _bands(self, num_samples: int) -> np.ndarray:
+        key = (num_samples, self.sample_rate)
+        if self._band_key != key:
+            nyquist = self.sample_rate / 2
+            edges_hz = np.geomspace(
+                ENERGY_MIN_HZ, min(ENERGY_MAX_HZ, nyquist), ENERGY_BANDS + 1
+            )
+            edges = np.round(edges_hz * num_samples / self.sample_rate).astype(int)
+            # Every band gets at least one FFT bin
+            for i in range(1, len(edges)):
+                edges[i] = max(edges[i], edges[i - 1] + 1)
+            self._band_edges = np.minimum(edges, num_samples // 2 + 1)
+            self._band_key = key
+            self._noise_floor = None
+        return self._band_edges
+
+    def _band_energies(self, buffer: bytes) -> np.ndarray:
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
+        power = np.abs(np.fft.rfft(samples)) ** 2
+        edges = self._bands(len(samples))
+        sums = np.add.reduceat(power[: edges[-1]], edges[:-1])
+        return np.log(sums + 1e-10)
+
+    def _update_noise_floor(self, energies: np.ndarray):
+        self._noise_floor += NOISE_FLOOR_ALPHA * (energies - self._noise_floor)
+
+    def voice_confidence(self, buffer) -> float:
+        energies = self._band_energies(buffer)
+        if self._noise_floor is None:
+            # Start at the digital silence level; rises with observed silence
+            self._noise_floor = np.full(ENERGY_BANDS, math.log(1e-10))
+
+        if np.all(energies < self._noise_floor + self._margin):
+            self._update_noise_floor(energies)
+            return 0.0
+
+        confidence = super().voice_confidence(buffer)
+        if confidence < SILENCE_CONFIDENCE:
+            self._update_noise_floor(energies)
+        return confidence
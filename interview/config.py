@@ -19,7 +19,9 @@ class InterviewConfig:
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
     ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+    ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "")
     SIMLI_API_KEY = os.getenv("SIMLI_API_KEY")
+    SIMLI_FACE_ID = os.getenv("SIMLI_FACE_ID")
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
     OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
@@ -28,6 +30,8 @@ class InterviewConfig:
     # Supabase Configuration
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+    # Direct Postgres connection string (used for LISTEN/NOTIFY by the evaluator)
+    SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
 
     # Service Configuration
     LANGUAGE = "en-US"
@@ -38,18 +42,27 @@ class InterviewConfig:
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
     DEEPSEEK_MODEL = os.getenv("DEEPSEEK_MODEL", "deepseek/deepseek-chat")
 
+    # Judge cache (opt-in; reuses provider results for identical evaluation payloads)
+    USE_JUDGE_CACHE = os.getenv("USE_JUDGE_CACHE", "").lower() in ("1", "true", "yes")
+    JUDGE_CACHE_DIR = os.getenv("JUDGE_CACHE_DIR", ".judge_cache")
+
+    REQUIRED_VARS = (
+        "GOOGLE_API_KEY",
+        "DEEPGRAM_API_KEY",
+        "ELEVENLABS_API_KEY",
+        "SIMLI_API_KEY",
+    )
+    _validated = False
+
     @classmethod
     def validate(cls):
-        """Validate that all required environment variables are set"""
-        required_vars = [
-            "GOOGLE_API_KEY",
-            "DEEPGRAM_API_KEY",
-            "ELEVENLABS_API_KEY",
-            "SIMLI_API_KEY",
-        ]
-
-        missing = [var for var in required_vars if not getattr(cls, var)]
+        """Validate that all required environment variables are set (checked once per process)"""
+        if cls._validated:
+            return True
+
+        missing = [var for var in cls.REQUIRED_VARS if not getattr(cls, var)]
         if missing:
             raise ValueError(f"Missing required environment variables: {missing}")
 
+        cls._validated = True
         return True
@@ -1,7 +1,7 @@
 # Context Service Package
 # Database and external service integrations
 
-from .services import QueueService
+from .services import QueueService, get_queue_service
 from .interview_repository import InterviewRepository
 from .evaluator_repository import (
     EvaluatorResultRepository,
@@ -10,11 +10,13 @@ from .evaluator_repository import (
     EvaluationRepository,
 )
 from .client import get_supabase_client
+from .db_pool import get_pool, close_pool
 from .base_repository import SupabaseBaseRepository
 from .models import InterviewContext
 
 __all__ = [
     "QueueService",
+    "get_queue_service",
     "InterviewRepository",
     "EvaluatorResultRepository",
     "EvaluatorPayloadRepository",
@@ -22,5 +24,7 @@ __all__ = [
     "EvaluationRepository",
     "InterviewContext",
     "get_supabase_client",
+    "get_pool",
+    "close_pool",
     "SupabaseBaseRepository",
 ]
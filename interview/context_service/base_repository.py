@@ -5,6 +5,7 @@ Provides common database operations with proper error handling.
 
 from typing import Optional, List, Dict, Any, TypeVar, Generic
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 from ..config import InterviewConfig
 from supabase import create_client, Client
@@ -39,7 +40,9 @@ class SupabaseBaseRepository(ABC, Generic[T]):
         """Create a new record"""
         try:
             data = self.to_dict(entity)
-            result = self.supabase.table(self.table_name).insert(data).execute()
+            result = await asyncio.to_thread(
+                self.supabase.table(self.table_name).insert(data).execute
+            )
 
             if result.data:
                 return self.from_dict(result.data[0])
@@ -50,14 +53,37 @@ class SupabaseBaseRepository(ABC, Generic[T]):
             self.logger.error(f"Error creating record in {self.table_name}: {e}")
             raise Exception(f"Database error: {e}")
 
+    async def create_many(self, entities: List[T]) -> List[T]:
+        """Create several records with a single bulk insert"""
+        if not entities:
+            return []
+
+        try:
+            data = [self.to_dict(entity) for entity in entities]
+            # PostgREST bulk inserts require every row to share the same keys
+            columns = set().union(*data)
+            data = [{column: row.get(column) for column in columns} for row in data]
+            result = await asyncio.to_thread(
+                self.supabase.table(self.table_name).insert(data).execute
+            )
+
+            if result.data:
+                return [self.from_dict(row) for row in result.data]
+            else:
+                raise Exception("Failed to create records - no data returned")
+
+        except Exception as e:
+            self.logger.error(f"Error creating records in {self.table_name}: {e}")
+            raise Exception(f"Database error: {e}")
+
     async def get_by_id(self, entity_id: str) -> Optional[T]:
         """Retrieve a record by ID"""
         try:
-            result = (
+            result = await asyncio.to_thread(
                 self.supabase.table(self.table_name)
                 .select("*")
                 .eq("id", entity_id)
-                .execute()
+                .execute
             )
 
             if result.data:
@@ -72,11 +98,11 @@ class SupabaseBaseRepository(ABC, Generic[T]):
         """Update an existing record"""
         try:
             data = self.to_dict(entity)
-            result = (
+            result = await asyncio.to_thread(
                 self.supabase.table(self.table_name)
                 .update(data)
                 .eq("id", entity_id)
-                .execute()
+                .execute
             )
 
             if result.data:
@@ -91,11 +117,11 @@ class SupabaseBaseRepository(ABC, Generic[T]):
     async def delete(self, entity_id: str) -> bool:
         """Delete a record"""
         try:
-            result = (
+            result = await asyncio.to_thread(
                 self.supabase.table(self.table_name)
                 .delete()
                 .eq("id", entity_id)
-                .execute()
+                .execute
             )
             return len(result.data) > 0
 
@@ -106,11 +132,11 @@ class SupabaseBaseRepository(ABC, Generic[T]):
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """List records with pagination"""
         try:
-            result = (
+            result = await asyncio.to_thread(
                 self.supabase.table(self.table_name)
                 .select("*")
                 .range(offset, offset + limit - 1)
-                .execute()
+                .execute
             )
             return [self.from_dict(data) for data in result.data]
 
@@ -7,6 +7,27 @@ import httpx
 from typing import Optional, List, Dict, Any
 from ..config import InterviewConfig
 
+# orjson encodes/decodes large payloads (full transcripts) several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _json_body(data: Any) -> Dict[str, Any]:
+    """Request kwargs for a JSON body, pre-encoded with orjson when installed"""
+    if orjson is not None:
+        # The client's default headers already set Content-Type: application/json
+        return {"content": orjson.dumps(data)}
+    return {"json": data}
+
 
 class SupabaseClient:
     """Simple HTTP client for Supabase REST API"""
@@ -19,12 +40,41 @@ class SupabaseClient:
             "Content-Type": "application/json",
             "Prefer": "return=representation",
         }
+        # Long-lived client so keep-alive connections (and TLS sessions) are reused
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use (and again after aclose)"""
+        if self._client is None or self._client.is_closed:
+            # http2/limits must be set on the transport when one is passed
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=40,
+                    keepalive_expiry=60.0,
+                ),
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=10.0,
+                transport=transport,
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
     async def get(
         self, table: str, filters: Dict[str, Any] = None
     ) -> List[Dict[str, Any]]:
         """GET request to Supabase table"""
-        url = f"{self.base_url}/{table}"
         params = {}
 
         if filters:
@@ -33,46 +83,60 @@ class SupabaseClient:
                     params[key] = str(value)
                 elif key == "order":
                     params[f"{key}"] = f"{value}.asc"  # Default to ascending
+                elif isinstance(value, (list, tuple, set)):
+                    # Match any of several values with a single request
+                    params[key] = "in.({})".format(",".join(f'"{v}"' for v in value))
                 else:
                     params[key] = f"eq.{value}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.get(f"/{table}", params=params)
+        response.raise_for_status()
+        return _decode_json(response)
 
     async def post(self, table: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """POST request to create record"""
-        url = f"{self.base_url}/{table}"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=data)
-            response.raise_for_status()
-            result = response.json()
-            return result[0] if isinstance(result, list) else result
+        response = await self.http.post(f"/{table}", **_json_body(data))
+        response.raise_for_status()
+        result = _decode_json(response)
+        return result[0] if isinstance(result, list) else result
 
     async def patch(
         self, table: str, filters: Dict[str, str], data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """PATCH request to update record"""
-        url = f"{self.base_url}/{table}"
         params = {}
 
         for key, value in filters.items():
             params[key] = f"eq.{value}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                url, headers=self.headers, params=params, json=data
-            )
-            response.raise_for_status()
-            result = response.json()
-
-            # PATCH might return empty array on successful update
-            if isinstance(result, list):
-                return result[0] if result else {"updated": True}
-            else:
-                return result
+        response = await self.http.patch(
+            f"/{table}", params=params, **_json_body(data)
+        )
+        response.raise_for_status()
+        result = _decode_json(response)
+
+        # PATCH might return empty array on successful update
+        if isinstance(result, list):
+            return result[0] if result else {"updated": True}
+        else:
+            return result
+
+    async def rpc(self, function: str, params: Dict[str, Any] = None) -> Any:
+        """POST request calling a Postgres function exposed by PostgREST"""
+        response = await self.http.post(f"/rpc/{function}", **_json_body(params or {}))
+        response.raise_for_status()
+        return _decode_json(response) if response.content else None
+
+    async def delete(self, table: str, filters: Dict[str, str]) -> List[Dict[str, Any]]:
+        """DELETE request to remove matching records"""
+        params = {}
+
+        for key, value in filters.items():
+            params[key] = f"eq.{value}"
+
+        response = await self.http.delete(f"/{table}", params=params)
+        response.raise_for_status()
+        return _decode_json(response) if response.content else []
 
 
 # Singleton instance
@@ -0,0 +1,79 @@
+"""
+Shared asyncpg connection pool for direct Postgres access.
+Used on hot write paths where a PostgREST round-trip per query is too costly.
+"""
+
+import asyncio
+import json
+from typing import Optional
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..config import InterviewConfig
+
+# Singleton pool
+_pool = None
+_pool_lock = asyncio.Lock()
+
+
+async def _init_connection(connection):
+    """
+    Register a jsonb codec so dicts can be bound directly as jsonb parameters
+
+    With orjson installed the binary jsonb format is used (a version byte
+    followed by the JSON text), otherwise the stdlib json module in text format.
+    """
+    if orjson is not None:
+        await connection.set_type_codec(
+            "jsonb",
+            encoder=lambda value: b"\x01" + orjson.dumps(value),
+            decoder=lambda data: orjson.loads(data[1:]),
+            schema="pg_catalog",
+            format="binary",
+        )
+    else:
+        await connection.set_type_codec(
+            "jsonb",
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
+async def get_pool() -> Optional["asyncpg.Pool"]:
+    """
+    Get the singleton asyncpg pool
+
+    Returns None when asyncpg is not installed or SUPABASE_DB_URL is not set,
+    in which case callers should fall back to the Supabase REST client.
+    """
+    global _pool
+    if _pool is None and asyncpg is not None and InterviewConfig.SUPABASE_DB_URL:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await asyncpg.create_pool(
+                    dsn=InterviewConfig.SUPABASE_DB_URL,
+                    min_size=10,
+                    max_size=50,
+                    max_inactive_connection_lifetime=300,
+                    # Supabase's transaction pooler does not support prepared statements
+                    statement_cache_size=0,
+                    init=_init_connection,
+                )
+    return _pool
+
+
+async def close_pool():
+    """Close the singleton pool if it was opened"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
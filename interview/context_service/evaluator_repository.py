@@ -331,6 +331,40 @@ class EvaluationRepository(SupabaseBaseRepository[Evaluation]):
     def from_dict(self, data: Dict[str, Any]) -> Evaluation:
         return Evaluation.from_dict(data)
 
+    async def create_many(
+        self, evaluations: List[Evaluation], connection=None
+    ) -> List[Evaluation]:
+        """
+        Bulk insert evaluations
+
+        When an asyncpg connection is given the rows are written with a single
+        executemany on that connection (so callers can share a transaction);
+        otherwise the Supabase REST bulk insert is used. raw_llm_response is
+        bound as a dict and encoded by the pool's jsonb codec.
+        """
+        if connection is None:
+            return await super().create_many(evaluations)
+
+        await connection.executemany(
+            """
+            INSERT INTO evaluations
+                (interview_id, evaluator_llm_model, score, reasoning, raw_llm_response, created_at)
+            VALUES ($1, $2, $3, $4, $5::jsonb, $6)
+            """,
+            [
+                (
+                    evaluation.interview_id,
+                    evaluation.evaluator_llm_model,
+                    evaluation.score,
+                    evaluation.reasoning,
+                    evaluation.raw_llm_response,
+                    evaluation.created_at,
+                )
+                for evaluation in evaluations
+            ],
+        )
+        return evaluations
+
     async def get_by_interview_id(self, interview_id: str) -> List[Evaluation]:
         """Get all evaluations for an interview"""
         try:
@@ -3,6 +3,7 @@ Interview repository implementation using Supabase.
 Handles CRUD operations for Interview entities.
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from ..evaluator.interview import Interview
 from .base_repository import SupabaseBaseRepository
@@ -40,6 +41,31 @@ class InterviewRepository(SupabaseBaseRepository[Interview]):
             self.logger.error(f"Error retrieving interview by interview_id: {e}")
             raise Exception(f"Database error: {e}")
 
+    async def update_status(
+        self, interview_id: str, status: str, connection=None
+    ) -> None:
+        """Update an interview's status, via asyncpg when a connection is given"""
+        try:
+            if connection is not None:
+                await connection.execute(
+                    "UPDATE interviews SET status = $1 WHERE interview_id = $2",
+                    status,
+                    interview_id,
+                )
+                return
+
+            # supabase-py is synchronous; keep the HTTP call off the event loop
+            await asyncio.to_thread(
+                self.supabase.table(self.table_name)
+                .update({"status": status})
+                .eq("interview_id", interview_id)
+                .execute
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error updating interview status: {e}")
+            raise Exception(f"Database error: {e}")
+
     async def get_transcript(self, interview_id: str) -> Optional[Dict[str, Any]]:
         """Get transcript data for an interview"""
         try:
@@ -2,9 +2,18 @@
 Context models and data structures for interview context handling
 """
 
-from typing import Dict, Any, List
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+# Formatted contexts by (interview_id, content hash), shared by every
+# InterviewContext built from the same queue record (e.g. bot
+# re-instantiations for one interview); an edited record gets a new entry
+_FORMATTED_CONTEXT_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_FORMATTED_CONTEXT_CACHE_SIZE = 256
+
 
 @dataclass
 class InterviewContext:
@@ -16,6 +25,9 @@ class InterviewContext:
     questions: List[Dict[str, Any]] = field(default_factory=list)
     evaluation_materials: Dict[str, Any] = field(default_factory=dict)
     interviewer_prompt: str = ""
+    _formatted: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def candidate_name(self) -> str:
@@ -55,8 +67,34 @@ class InterviewContext:
             questions_text += f"{i}. {question.get('text', 'N/A')} (Type: {question.get('type', 'N/A')})\n"
         return questions_text
 
+    def content_hash(self) -> str:
+        """Hash of every field that goes into the formatted context"""
+        content = json.dumps(
+            [
+                self.interviewer_prompt,
+                self.candidate_name,
+                self.job_title,
+                self.resume_text,
+                self.job_description,
+                self.questions,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
     def format_full_context(self) -> str:
-        """Format the complete interview context for LLM"""
+        """Format the complete interview context for LLM (memoized per interview)"""
+        if self._formatted is not None:
+            return self._formatted
+
+        cache_key = (self.interview_id, self.content_hash())
+        cached = _FORMATTED_CONTEXT_CACHE.get(cache_key)
+        if cached is not None:
+            _FORMATTED_CONTEXT_CACHE.move_to_end(cache_key)
+            self._formatted = cached
+            return cached
+
         # Replace placeholder variables in the interviewer prompt
         prompt = self.interviewer_prompt
         if prompt and self.candidate_name:
@@ -65,6 +103,12 @@ class InterviewContext:
 
         # Combine all parts
         full_context = prompt + self.format_context_details() + self.format_questions()
+
+        self._formatted = full_context
+        if self.interview_id:
+            _FORMATTED_CONTEXT_CACHE[cache_key] = full_context
+            if len(_FORMATTED_CONTEXT_CACHE) > _FORMATTED_CONTEXT_CACHE_SIZE:
+                _FORMATTED_CONTEXT_CACHE.popitem(last=False)
         return full_context
 
     @classmethod
@@ -3,15 +3,26 @@ Simple Supabase operations for the evaluator service.
 Handles the 4 core operations: get interview queue, get evaluator queue, write transcript, write evaluation.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
+
+from loguru import logger
+
 from .client import get_supabase_client
 
+# Most auth tokens fetched from interviewer_queue in one request
+CONTEXT_BATCH_SIZE = 16
+
 
 class QueueService:
     """Service for retrieving formed JSON from queue tables via edge functions"""
 
     def __init__(self):
         self.client = get_supabase_client()
+        # Interview context lookups waiting for the next batched request
+        self._pending_contexts: Dict[str, List[asyncio.Future]] = {}
+        self._context_fetch: Optional[asyncio.Task] = None
 
     async def get_interview_from_queue(
         self, auth_token: str
@@ -28,25 +39,64 @@ class QueueService:
             return None
 
         except Exception as e:
-            print(f"Error getting interview from evaluator queue: {e}")
+            logger.error("Error getting interview from evaluator queue: {}", e)
             return None
 
     async def get_interview_context_from_queue(
         self, auth_token: str
     ) -> Optional[Dict[str, Any]]:
-        """Retrieve interview context from interviewer_queue by auth token"""
+        """
+        Retrieve interview context from interviewer_queue by auth token
+
+        Lookups made while another one is in flight are batched into a single
+        auth_token IN (...) request once it completes; a lone lookup is sent
+        immediately.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_contexts.setdefault(auth_token, []).append(future)
+        if self._context_fetch is None:
+            self._context_fetch = asyncio.create_task(self._fetch_pending_contexts())
+        return await future
+
+    async def _fetch_pending_contexts(self):
+        batch: Dict[str, List[asyncio.Future]] = {}
         try:
-            results = await self.client.get(
-                "interviewer_queue", {"auth_token": auth_token}
-            )
-
-            if results:
-                return results[0]  # The interview context
-            return None
-
+            while self._pending_contexts:
+                auth_tokens = list(self._pending_contexts)[:CONTEXT_BATCH_SIZE]
+                batch = {token: self._pending_contexts.pop(token) for token in auth_tokens}
+                records = await self._fetch_contexts(auth_tokens)
+                for token, futures in batch.items():
+                    for future in futures:
+                        if not future.done():
+                            future.set_result(records.get(token))
+        finally:
+            self._context_fetch = None
+            # Cancelled or failed mid-batch: no caller may be left waiting,
+            # so unresolved lookups get None as on any other fetch error
+            leftovers, self._pending_contexts = self._pending_contexts, {}
+            for futures in (*batch.values(), *leftovers.values()):
+                for future in futures:
+                    if not future.done():
+                        future.set_result(None)
+
+    async def _fetch_contexts(self, auth_tokens: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Interview contexts for auth_tokens, keyed by auth token"""
+        try:
+            filters = {
+                "auth_token": auth_tokens[0] if len(auth_tokens) == 1 else auth_tokens
+            }
+            results = await self.client.get("interviewer_queue", filters)
         except Exception as e:
-            print(f"Error getting interview context from interviewer_queue: {e}")
-            return None
+            logger.error("Error getting interview context from interviewer_queue: {}", e)
+            return {}
+
+        records: Dict[str, Dict[str, Any]] = {}
+        for record in results:
+            # First row per token, as the single-token lookup returned
+            records.setdefault(record.get("auth_token"), record)
+        if len(auth_tokens) == 1 and results:
+            records.setdefault(auth_tokens[0], results[0])
+        return records
 
     async def get_next_evaluation_task(self) -> Optional[Dict[str, Any]]:
         """Get the next available evaluation task from evaluator_queue"""
@@ -61,9 +111,56 @@ class QueueService:
             return None
 
         except Exception as e:
-            print(f"Error getting next evaluation task: {e}")
+            logger.error("Error getting next evaluation task: {}", e)
             return None
 
+    async def claim_evaluation_tasks(
+        self, limit: int = 16, lease_seconds: int = 900
+    ) -> List[Dict[str, Any]]:
+        """
+        Claim up to `limit` of the oldest available evaluation tasks
+
+        Claimed rows are hidden from other workers for lease_seconds (see
+        supabase/evaluator_queue_claims.sql), so concurrent evaluators never
+        process the same interview.
+        """
+        try:
+            return await self.client.rpc(
+                "claim_evaluator_tasks",
+                {"batch_size": limit, "lease_seconds": lease_seconds},
+            ) or []
+
+        except Exception as e:
+            logger.error("Error claiming evaluation tasks: {}", e)
+            return []
+
+    async def retry_evaluation_task(
+        self, interview_id: str, attempts: int, delay_seconds: float
+    ) -> bool:
+        """Record a failed attempt and hide the task from workers for delay_seconds"""
+        available_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+        try:
+            await self.client.patch(
+                "evaluator_queue",
+                {"interview_id": interview_id},
+                {"attempts": attempts, "available_at": available_at.isoformat()},
+            )
+            return True
+
+        except Exception as e:
+            logger.error("Error scheduling evaluation task retry: {}", e)
+            return False
+
+    async def remove_evaluation_task(self, interview_id: str) -> bool:
+        """Remove a processed evaluation task from evaluator_queue"""
+        try:
+            await self.client.delete("evaluator_queue", {"interview_id": interview_id})
+            return True
+
+        except Exception as e:
+            logger.error("Error removing evaluation task: {}", e)
+            return False
+
     async def get_evaluator_from_queue(
         self, interview_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -79,7 +176,7 @@ class QueueService:
             return None
 
         except Exception as e:
-            print(f"Error getting evaluator from queue: {e}")
+            logger.error("Error getting evaluator from queue: {}", e)
             return None
 
 
@@ -97,60 +194,50 @@ class TranscriptService:
         audio_path: str = None,
     ) -> bool:
         """Write finalized interview to transcripts table AND update interviews status to completed"""
-        transcript_success = False
-        status_update_success = False
+        # Step 1: Insert transcript data
+        transcript_data = {
+            "interview_id": interview_id,
+            "full_text": full_text,
+            "transcript_json": transcript_json,
+        }
 
-        try:
-            # Step 1: Insert transcript data
-            transcript_data = {
-                "interview_id": interview_id,
-                "full_text": full_text,
-                "transcript_json": transcript_json,
-            }
-
-            # Only include audio_path if provided
-            if audio_path:
-                transcript_data["audio_path"] = audio_path
+        # Only include audio_path if provided
+        if audio_path:
+            transcript_data["audio_path"] = audio_path
 
+        try:
             await self.client.post("transcripts", transcript_data)
-            print(f"✅ Successfully inserted transcript for interview {interview_id}")
-            transcript_success = True
-
+            logger.info("Successfully inserted transcript for interview {}", interview_id)
         except Exception as e:
-            print(f"❌ Error inserting transcript: {e}")
+            logger.error("Error inserting transcript: {}", e)
             return False
 
+        # Step 2: Update interviews table status from 'scheduled' to 'completed'.
+        # Only after the transcript exists: the evaluation trigger needs both,
+        # and a completed interview without a transcript is never retried
+        # This might fail due to RLS policies on the interviews table
         try:
-            # Step 2: Update interviews table status from 'scheduled' to 'completed'
-            # This might fail due to RLS policies on the interviews table
-            status_update = {"status": "completed"}
-
             await self.client.patch(
-                "interviews", {"interview_id": interview_id}, status_update
+                "interviews", {"interview_id": interview_id}, {"status": "completed"}
             )
-            print(
-                f"✅ Successfully updated interviews table record {interview_id} status to 'completed'"
+            logger.info(
+                "Successfully updated interviews table record {} status to 'completed'",
+                interview_id,
             )
-            status_update_success = True
-
+            logger.info("Complete success: Transcript saved AND status updated")
         except Exception as e:
-            print(f"⚠️ Could not update interview status (likely RLS restriction): {e}")
-            print(
-                f"💡 Transcript was saved successfully. Status update requires proper permissions."
+            logger.warning(
+                "Could not update interview status (likely RLS restriction): {}", e
+            )
+            logger.info(
+                "Transcript was saved successfully. Status update requires proper permissions."
+            )
+            logger.warning(
+                "Partial success: Transcript saved but status update failed due to permissions"
             )
-            status_update_success = False
 
         # Return True if transcript was saved (the critical operation)
-        if transcript_success:
-            if status_update_success:
-                print(f"🎉 Complete success: Transcript saved AND status updated")
-            else:
-                print(
-                    f"⚠️ Partial success: Transcript saved but status update failed due to permissions"
-                )
-            return True
-        else:
-            return False
+        return True
 
 
 class EvaluationService:
@@ -179,8 +266,10 @@ class EvaluationService:
             }
 
             await self.client.post("evaluations", evaluation_data)
-            print(
-                f"✅ Successfully inserted {evaluator_llm_model} evaluation for interview {interview_id}"
+            logger.info(
+                "Successfully inserted {} evaluation for interview {}",
+                evaluator_llm_model,
+                interview_id,
             )
 
             # Step 2: Check if this is the final evaluation (all 3 providers completed)
@@ -198,8 +287,9 @@ class EvaluationService:
 
             # If we have all 3 evaluations, update interview status to 'evaluated'
             if len(unique_models) >= 3:
-                print(
-                    f"🎯 All evaluations complete for interview {interview_id}, updating status to 'evaluated'"
+                logger.info(
+                    "All evaluations complete for interview {}, updating status to 'evaluated'",
+                    interview_id,
                 )
 
                 status_update = {"status": "evaluated"}
@@ -207,16 +297,30 @@ class EvaluationService:
                 await self.client.patch(
                     "interviews", {"interview_id": interview_id}, status_update
                 )
-                print(
-                    f"✅ Successfully updated interview {interview_id} status to 'evaluated'"
+                logger.info(
+                    "Successfully updated interview {} status to 'evaluated'", interview_id
                 )
             else:
-                print(
-                    f"📊 {len(unique_models)}/3 evaluations completed for interview {interview_id}"
+                logger.info(
+                    "{}/3 evaluations completed for interview {}",
+                    len(unique_models),
+                    interview_id,
                 )
 
             return True
 
         except Exception as e:
-            print(f"Error writing evaluation and updating status: {e}")
+            logger.error("Error writing evaluation and updating status: {}", e)
             return False
+
+
+# Singleton instance
+_queue_service = None
+
+
+def get_queue_service() -> QueueService:
+    """Get singleton QueueService"""
+    global _queue_service
+    if _queue_service is None:
+        _queue_service = QueueService()
+    return _queue_service
@@ -32,6 +32,24 @@ class ContextService:
         """Get next available evaluation task"""
         return await self.queue_service.get_next_evaluation_task()
 
+    async def claim_evaluation_tasks(
+        self, limit: int = 16, lease_seconds: int = 900
+    ) -> List[Dict[str, Any]]:
+        """Claim a batch of pending evaluation tasks for this worker"""
+        return await self.queue_service.claim_evaluation_tasks(limit, lease_seconds)
+
+    async def retry_evaluation_task(
+        self, interview_id: str, attempts: int, delay_seconds: float
+    ) -> bool:
+        """Put a failed task back on the queue after delay_seconds"""
+        return await self.queue_service.retry_evaluation_task(
+            interview_id, attempts, delay_seconds
+        )
+
+    async def complete_evaluation_task(self, interview_id: str) -> bool:
+        """Remove an evaluated task from the queue"""
+        return await self.queue_service.remove_evaluation_task(interview_id)
+
     async def save_transcript(
         self, interview_id: str, transcript_data: Dict[str, Any]
     ) -> bool:
@@ -7,16 +7,19 @@ import asyncio
 import logging
 import json
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 import uuid
 
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
 from ..config import InterviewConfig
 from ..context_service_integration import ContextService
-from ..context_service.evaluator_repository import (
-    Evaluation,
-    EvaluationRepository,
-)
+from ..context_service.db_pool import get_pool, close_pool
+from ..context_service.evaluator_repository import Evaluation
 from .interview import (
     Interview,
     Candidate,
@@ -27,7 +30,36 @@ from .interview import (
     TranscriptEntry,
     QuestionAnswer,
 )
-from .helpers import EvaluationHelper
+from .helpers import EvaluationHelper, RealLLMEvaluator
+from .judge_cache import JudgeCache
+
+# Fallbacks for payloads without evaluation materials; built once and shared
+# (read-only) by every interview instead of being rebuilt per task
+_DEFAULT_RUBRIC = Rubric(
+    name="Technical Interview Rubric",
+    version=1,
+    criteria={
+        "technical_proficiency": "Understanding of core concepts, problem-solving approach, code quality and efficiency (1-10)",
+        "communication_skills": "Clarity of explanations, ability to articulate thought process, professionalism (1-10)",
+        "cultural_fit": "Alignment with company values, enthusiasm for the role, collaboration mindset (1-10)",
+    },
+)
+
+# Result slot -> configured model, used when a provider result carries no model name
+_EVALUATION_MODELS = (
+    ("evaluation_1", InterviewConfig.OPENAI_MODEL),
+    ("evaluation_2", InterviewConfig.GEMINI_MODEL),
+    ("evaluation_3", InterviewConfig.DEEPSEEK_MODEL.split("/")[-1]),
+)
+
+_DEFAULT_EVALUATOR_PROMPT = (
+    "You are an expert technical recruiter and hiring manager. "
+    "Your task is to evaluate the provided interview transcript based on the "
+    "job description and the rubric. Provide a detailed, constructive, and "
+    "unbiased evaluation. Assess the candidate's technical skills, "
+    "communication abilities, and overall fit for the role. "
+    "Provide scores for each category in the rubric and a final summary."
+)
 
 
 class BackgroundEvaluatorAgent:
@@ -35,72 +67,236 @@ class BackgroundEvaluatorAgent:
     Background agent that monitors evaluator_queue and processes completed interviews.
 
     This agent:
-    1. Polls the evaluator_queue table for completed interviews
+    1. Waits for evaluator_queue inserts (LISTEN/NOTIFY, with a polling fallback)
     2. Converts queue data to Interview objects
     3. Runs LLM evaluation on transcripts
     4. Stores evaluation results in the database
     5. Updates interview status
     """
 
-    def __init__(self):
-        InterviewConfig.validate()  # Ensure configuration is valid
-        self.context_service = ContextService()
+    def __init__(self, context_service: ContextService = None):
+        # ContextService validates the configuration
+        self.context_service = context_service or ContextService()
+        # Reuse the context service's repositories for every task
+        self.evaluation_repo = self.context_service.evaluator_repo
+        self.interview_repo = self.context_service.interview_repo
         self.evaluation_helper = EvaluationHelper()
+        self.llm_evaluator = RealLLMEvaluator()
+        self.judge_cache = (
+            JudgeCache(InterviewConfig.JUDGE_CACHE_DIR)
+            if InterviewConfig.USE_JUDGE_CACHE
+            else None
+        )
         self.logger = logging.getLogger(__name__)
         self.running = False
-        self.poll_interval = 30  # seconds between queue checks
+        self.poll_interval = 30  # max seconds between queue checks without LISTEN/NOTIFY
+        self.notify_fallback_interval = 60  # safety re-check in case a NOTIFY is missed
+        self.batch_size = 16  # queue rows claimed per round-trip
+        self.evaluation_lease = 900  # seconds a claimed row is hidden from other workers
+        self.retry_delay = 30  # seconds before a failed task is retried, doubled per attempt
+        self.max_retry_delay = 3600  # cap on the retry delay
+        self.max_concurrent_evaluations = 4  # worker tasks running LLM evaluations
+        self.max_pending_evaluations = 16  # bounded hand-off between poller and workers
+        self.notify_channel = "evaluator_queue_new"
+        self._queue_event = asyncio.Event()
+        self._task_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.max_pending_evaluations
+        )
+        self._in_flight: set = set()  # interview_ids claimed here but not yet finished
+        self._backoff = 1.0  # current polling delay, doubled on every empty poll
 
     async def start(self):
         """Start the background evaluator agent"""
         self.running = True
         self.logger.info("Starting Background Evaluator Agent...")
 
-        while self.running:
-            try:
-                await self._process_pending_evaluations()
-                await asyncio.sleep(self.poll_interval)
-            except Exception as e:
-                self.logger.error(f"Error in evaluation processing loop: {e}")
-                await asyncio.sleep(self.poll_interval)
+        listener = await self._open_queue_listener()
+        workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.max_concurrent_evaluations)
+        ]
+
+        try:
+            while self.running:
+                # Clear before processing so inserts that land mid-run wake us again
+                self._queue_event.clear()
+                queued = 0
+                try:
+                    queued = await self._process_pending_evaluations()
+                except Exception as e:
+                    self.logger.error(f"Error in evaluation processing loop: {e}")
+
+                if listener:
+                    wait_timeout = self.notify_fallback_interval
+                else:
+                    wait_timeout = self._next_poll_delay(queued)
+
+                try:
+                    await asyncio.wait_for(self._queue_event.wait(), wait_timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if listener:
+                await listener.close()
+            await close_pool()
+
+    def _next_poll_delay(self, queued: int) -> float:
+        """
+        Exponential backoff for the polling fallback
+
+        Returns:
+            Seconds to wait before the next poll: short right after new work
+            was found, doubling otherwise up to poll_interval
+        """
+        if queued:
+            self._backoff = 0.5
+            return self._backoff
+
+        delay = self._backoff
+        self._backoff = min(self._backoff * 2, self.poll_interval)
+        return delay
+
+    async def _open_queue_listener(self):
+        """
+        Subscribe to evaluator_queue insert notifications
+
+        Returns:
+            The asyncpg connection holding the listener, or None when LISTEN/NOTIFY
+            is unavailable and the agent should fall back to polling
+        """
+        if asyncpg is None or not InterviewConfig.SUPABASE_DB_URL:
+            self.logger.info(
+                f"LISTEN/NOTIFY not configured, polling with backoff up to {self.poll_interval}s"
+            )
+            return None
+
+        try:
+            connection = await asyncpg.connect(InterviewConfig.SUPABASE_DB_URL)
+            await connection.add_listener(self.notify_channel, self._on_queue_notify)
+            self.logger.info(f"Listening for notifications on {self.notify_channel}")
+            return connection
+        except Exception as e:
+            self.logger.error(f"Failed to set up queue listener, falling back to polling: {e}")
+            return None
+
+    def _on_queue_notify(self, connection, pid, channel, payload):
+        """asyncpg listener callback: wake the processing loop"""
+        self._queue_event.set()
 
     def stop(self):
         """Stop the background evaluator agent"""
         self.logger.info("Stopping Background Evaluator Agent...")
         self.running = False
+        self._queue_event.set()
+
+    async def _process_pending_evaluations(self) -> int:
+        """
+        Claim pending tasks in batches and hand them to the evaluation workers
 
-    async def _process_pending_evaluations(self):
-        """Process all pending evaluations in the queue"""
+        Claimed rows are leased to this worker (hidden from other evaluator
+        replicas) until they are evaluated or the lease expires. Enqueueing
+        blocks while the bounded queue is full, so claiming slows down to the
+        pace of the workers instead of buffering transcripts.
+
+        Returns:
+            int: Number of new (never attempted) tasks handed to the workers;
+            retries of failed tasks don't count, so they don't reset the
+            polling backoff
+        """
+        queued = 0
         try:
-            # Get next evaluation task from queue
-            evaluation_task = await self.context_service.get_evaluation_task()
+            while self.running:
+                evaluation_tasks = await self.context_service.claim_evaluation_tasks(
+                    self.batch_size, self.evaluation_lease
+                )
 
-            if not evaluation_task:
-                # No pending evaluations
-                return
+                # A lease can run out while the task is still queued or running
+                # here; the row was re-claimed by us, so don't evaluate it twice
+                new_tasks = [
+                    evaluation_task
+                    for evaluation_task in evaluation_tasks
+                    if evaluation_task.get("interview_id") not in self._in_flight
+                ]
 
-            self.logger.info(f"Processing evaluation task: {evaluation_task.get('id')}")
+                if not new_tasks:
+                    return queued
 
-            # Process the evaluation
-            success = await self._process_evaluation_task(evaluation_task)
+                self.logger.info(f"Queueing {len(new_tasks)} evaluation tasks")
 
-            if success:
-                self.logger.info(
-                    f"Successfully processed evaluation: {evaluation_task.get('id')}"
-                )
-            else:
-                self.logger.error(
-                    f"Failed to process evaluation: {evaluation_task.get('id')}"
-                )
+                # One timestamp for the whole batch instead of one per result
+                batch_ts = datetime.now(timezone.utc).isoformat()
+
+                for evaluation_task in new_tasks:
+                    interview_id = evaluation_task.get("interview_id")
+                    self._in_flight.add(interview_id)
+                    await self._task_queue.put((evaluation_task, batch_ts))
+                    if not evaluation_task.get("attempts"):
+                        queued += 1
+
+                if len(evaluation_tasks) < self.batch_size:
+                    return queued
 
         except Exception as e:
             self.logger.error(f"Error processing pending evaluations: {e}")
 
-    async def _process_evaluation_task(self, evaluation_task: Dict[str, Any]) -> bool:
+        return queued
+
+    async def _worker(self):
+        """Evaluate tasks from the bounded queue until cancelled"""
+        while True:
+            evaluation_task, evaluated_at = await self._task_queue.get()
+            interview_id = evaluation_task.get("interview_id")
+            success = False
+            try:
+                self.logger.info(f"Processing evaluation task: {interview_id}")
+
+                success = await self._process_evaluation_task(
+                    evaluation_task, evaluated_at
+                )
+
+                if success:
+                    await self.context_service.complete_evaluation_task(interview_id)
+                    self.logger.info(f"Successfully processed evaluation: {interview_id}")
+                else:
+                    self.logger.error(f"Failed to process evaluation: {interview_id}")
+            except Exception as e:
+                self.logger.error(f"Error in evaluation worker: {e}")
+            finally:
+                self._in_flight.discard(interview_id)
+                self._task_queue.task_done()
+
+            # Not on cancellation: an interrupted task is retried once its lease expires
+            if not success and interview_id:
+                await self._schedule_retry(evaluation_task)
+
+    async def _schedule_retry(self, evaluation_task: Dict[str, Any]):
+        """Hide a failed task from every worker for a delay that doubles per attempt"""
+        attempts = (evaluation_task.get("attempts") or 0) + 1
+        delay = min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
+        interview_id = evaluation_task.get("interview_id")
+        self.logger.warning(
+            f"Retrying evaluation {interview_id} in {delay}s (attempt {attempts} failed)"
+        )
+        try:
+            await self.context_service.retry_evaluation_task(
+                interview_id, attempts, delay
+            )
+        except Exception as e:
+            # The claim's lease still keeps the row from being retried at once
+            self.logger.error(f"Failed to schedule evaluation retry: {e}")
+
+    async def _process_evaluation_task(
+        self, evaluation_task: Dict[str, Any], evaluated_at: Optional[str] = None
+    ) -> bool:
         """
         Process a single evaluation task from the queue
 
         Args:
             evaluation_task: The evaluation task data from evaluator_queue
+            evaluated_at: ISO timestamp shared by the batch (defaults to now)
 
         Returns:
             bool: True if processing was successful
@@ -122,7 +318,7 @@ class BackgroundEvaluatorAgent:
             interview = self._create_interview_from_payload(payload)
 
             # Run LLM evaluation
-            evaluation_results = await self._run_llm_evaluation(interview)
+            evaluation_results = await self._run_llm_evaluation(interview, evaluated_at)
 
             # Store evaluation results
             success = await self._store_evaluation_results(
@@ -164,16 +360,11 @@ class BackgroundEvaluatorAgent:
         full_text = transcript_payload.get("full_text_transcript", "")
 
         # Convert structured transcript to TranscriptEntry objects
-        structured_transcript_data = transcript_payload.get("structured_transcript", [])
-        structured_transcript = []
-        for entry in structured_transcript_data:
-            if isinstance(entry, dict):
-                structured_transcript.append(
-                    TranscriptEntry(
-                        speaker=entry.get("speaker", "unknown"),
-                        text=entry.get("text", ""),
-                    )
-                )
+        structured_transcript = [
+            TranscriptEntry(entry.get("speaker", "unknown"), entry.get("text", ""))
+            for entry in transcript_payload.get("structured_transcript", [])
+            if isinstance(entry, dict)
+        ]
 
         transcript = TranscriptData(
             full_text_transcript=full_text, structured_transcript=structured_transcript
@@ -182,31 +373,13 @@ class BackgroundEvaluatorAgent:
         # Extract evaluation materials from payload
         eval_materials_payload = payload.get("evaluation_materials", {})
 
-        # Use the rubric from payload or create a default one
+        # Use the rubric from payload or the shared default
         rubric_data = eval_materials_payload.get("rubric", {})
-        if rubric_data:
-            rubric = Rubric.from_dict(rubric_data)
-        else:
-            # Fallback rubric
-            rubric = Rubric(
-                name="Technical Interview Rubric",
-                version=1,
-                criteria={
-                    "technical_proficiency": "Understanding of core concepts, problem-solving approach, code quality and efficiency (1-10)",
-                    "communication_skills": "Clarity of explanations, ability to articulate thought process, professionalism (1-10)",
-                    "cultural_fit": "Alignment with company values, enthusiasm for the role, collaboration mindset (1-10)",
-                },
-            )
+        rubric = Rubric.from_dict(rubric_data) if rubric_data else _DEFAULT_RUBRIC
 
         # Use evaluator prompt from payload or default
         evaluator_prompt = eval_materials_payload.get(
-            "evaluator_prompt",
-            "You are an expert technical recruiter and hiring manager. "
-            "Your task is to evaluate the provided interview transcript based on the "
-            "job description and the rubric. Provide a detailed, constructive, and "
-            "unbiased evaluation. Assess the candidate's technical skills, "
-            "communication abilities, and overall fit for the role. "
-            "Provide scores for each category in the rubric and a final summary.",
+            "evaluator_prompt", _DEFAULT_EVALUATOR_PROMPT
         )
 
         evaluation_materials = EvaluationMaterials(
@@ -214,63 +387,84 @@ class BackgroundEvaluatorAgent:
         )
 
         # Extract questions and answers if available
-        questions_answers_data = payload.get("questions_and_answers", [])
-        questions_answers = []
-        for qa in questions_answers_data:
-            if isinstance(qa, dict):
-                questions_answers.append(
-                    QuestionAnswer(
-                        position=qa.get("position", 0),
-                        question_text=qa.get("question_text", ""),
-                        ideal_answer=qa.get("ideal_answer", ""),
-                    )
-                )
+        questions_answers = [
+            QuestionAnswer(
+                qa.get("position", 0),
+                qa.get("question_text", ""),
+                qa.get("ideal_answer", ""),
+            )
+            for qa in payload.get("questions_and_answers", [])
+            if isinstance(qa, dict)
+        ]
 
-        # Create the Interview object
+        # Create the Interview object (defaults are used when no questions are provided)
         interview = Interview(
             interview_id=payload.get("interview_id", "unknown"),
             candidate=candidate,
             job=job,
             transcript_data=transcript,
             evaluation_materials=evaluation_materials,
+            questions_and_answers=questions_answers,
         )
 
-        # Add questions and answers if available
-        if questions_answers:
-            interview.questions_answers = questions_answers
-
         return interview
 
-    async def _run_llm_evaluation(self, interview: Interview) -> Dict[str, Any]:
+    async def _run_llm_evaluation(
+        self, interview: Interview, evaluated_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Run LLM evaluation on the interview
 
+        The three providers are dispatched concurrently, so the wall-clock cost is
+        the slowest provider rather than the sum of all three. A failing provider
+        is reported in its own evaluation slot without affecting the others.
+
         Args:
             interview: The Interview object to evaluate
+            evaluated_at: ISO timestamp shared by the batch (defaults to now)
 
         Returns:
             Dict containing evaluation results
         """
+        evaluated_at = evaluated_at or datetime.now(timezone.utc).isoformat()
+
         try:
-            # For now, use the placeholder evaluation
-            # TODO: Implement actual LLM API calls (TODO 04 and TODO 05)
-            evaluation_result = await self.evaluation_helper.run_full_evaluation(
-                {
-                    "interview_id": interview.interview_id,
-                    "transcript": interview.transcript_data.full_text_transcript,
-                    "job_description": interview.job.description,
-                    "rubric": interview.evaluation_materials.rubric.to_dict(),
-                    "evaluator_prompt": interview.evaluation_materials.evaluator_prompt,
+            # Build the shared request data once for all providers
+            payload = {
+                "transcript": interview.transcript_data.full_text_transcript,
+                "job_description": interview.job.description,
+                "evaluator_prompt": interview.evaluation_materials.evaluator_prompt,
+            }
+
+            if not payload["transcript"] or not payload["job_description"]:
+                return {
+                    "error": "Transcript or job description missing",
+                    "overall_score": 0,
+                    "recommendation": "Missing data for evaluation",
+                    "evaluated_at": evaluated_at,
                 }
+
+            cache_key = JudgeCache.make_key(payload) if self.judge_cache else None
+
+            results = await asyncio.gather(
+                self._call_openai(payload, cache_key),
+                self._call_gemini(payload, cache_key),
+                self._call_deepseek(payload, cache_key),
+                return_exceptions=True,
+            )
+
+            evaluation_result = self.evaluation_helper.combine_evaluations(
+                interview.interview_id, results, evaluated_at
             )
+            evaluations = evaluation_result["evaluations"]
 
             return {
-                "evaluation_1": evaluation_result.get("evaluations", {}).get("evaluation_1"),  # OpenAI result
-                "evaluation_2": evaluation_result.get("evaluations", {}).get("evaluation_2"),  # Google result
-                "evaluation_3": evaluation_result.get("evaluations", {}).get("evaluation_3"),  # DeepSeek result
+                "evaluation_1": evaluations.get("evaluation_1"),  # OpenAI result
+                "evaluation_2": evaluations.get("evaluation_2"),  # Google result
+                "evaluation_3": evaluations.get("evaluation_3"),  # DeepSeek result
                 "overall_score": evaluation_result.get("overall_score", 0),
                 "recommendation": evaluation_result.get("recommendation", "Unknown"),
-                "evaluated_at": evaluation_result.get("evaluated_at", datetime.now().isoformat()),
+                "evaluated_at": evaluation_result["evaluated_at"],
                 "combined_result": evaluation_result,  # Store full combined result for reference
             }
 
@@ -280,9 +474,66 @@ class BackgroundEvaluatorAgent:
                 "error": str(e),
                 "overall_score": 0,
                 "recommendation": "Evaluation failed",
-                "evaluated_at": datetime.now().isoformat(),
+                "evaluated_at": evaluated_at,
             }
 
+    async def _call_openai(
+        self, payload: Dict[str, str], cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Evaluate the shared payload with OpenAI"""
+        return await self._cached_call(
+            self.llm_evaluator.openai_model,
+            self.llm_evaluator.evaluate_with_openai,
+            payload,
+            cache_key,
+        )
+
+    async def _call_gemini(
+        self, payload: Dict[str, str], cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Evaluate the shared payload with Google Gemini"""
+        return await self._cached_call(
+            self.llm_evaluator.google_model,
+            self.llm_evaluator.evaluate_with_google,
+            payload,
+            cache_key,
+        )
+
+    async def _call_deepseek(
+        self, payload: Dict[str, str], cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Evaluate the shared payload with DeepSeek"""
+        return await self._cached_call(
+            self.llm_evaluator.deepseek_model,
+            self.llm_evaluator.evaluate_with_deepseek,
+            payload,
+            cache_key,
+        )
+
+    async def _cached_call(
+        self,
+        model: str,
+        evaluate,
+        payload: Dict[str, str],
+        cache_key: Optional[str],
+    ) -> Dict[str, Any]:
+        """Run a provider evaluation, consulting the judge cache when enabled"""
+        if self.judge_cache and cache_key:
+            cached = await self.judge_cache.get(model, cache_key)
+            if cached is not None:
+                self.logger.info(f"Judge cache hit for {model}")
+                return cached
+
+        result = await evaluate(
+            payload["transcript"], payload["job_description"], payload["evaluator_prompt"]
+        )
+
+        # Never cache failures so they are retried on the next run
+        if self.judge_cache and cache_key and "error" not in result:
+            await self.judge_cache.set(model, cache_key, result)
+
+        return result
+
     async def _store_evaluation_results(
         self, interview_id: str, evaluation_results: Dict[str, Any]
     ) -> bool:
@@ -298,49 +549,36 @@ class BackgroundEvaluatorAgent:
         """
         try:
             # Create Evaluation objects for each evaluation
-            evaluation_repo = EvaluationRepository()
-
-            # Store evaluation_1
-            if evaluation_results.get("evaluation_1"):
-                eval_data = evaluation_results["evaluation_1"]
-                evaluation_1 = Evaluation(
+            evaluations = [
+                Evaluation(
                     interview_id=interview_id,
-                    evaluator_llm_model=eval_data.get("model"),
-                    score=eval_data.get("overall_score"),
+                    evaluator_llm_model=eval_data.get("model") or model,
+                    score=eval_data.get("overall_score", eval_data.get("score")),
                     reasoning=eval_data.get("overall_reasoning") or eval_data.get("reasoning", ""),
                     raw_llm_response=eval_data,
                 )
-                await evaluation_repo.create(evaluation_1)
-
-            # Store evaluation_2
-            if evaluation_results.get("evaluation_2"):
-                eval_data = evaluation_results["evaluation_2"]
-                evaluation_2 = Evaluation(
-                    interview_id=interview_id,
-                    evaluator_llm_model=eval_data.get("model"),
-                    score=eval_data.get("overall_score"),
-                    reasoning=eval_data.get("overall_reasoning") or eval_data.get("reasoning", ""),
-                    raw_llm_response=eval_data,
-                )
-                await evaluation_repo.create(evaluation_2)
-
-            # Store evaluation_3
-            if evaluation_results.get("evaluation_3"):
-                eval_data = evaluation_results["evaluation_3"]
-                evaluation_3 = Evaluation(
-                    interview_id=interview_id,
-                    evaluator_llm_model=eval_data.get("model"),
-                    score=eval_data.get("overall_score"),
-                    reasoning=eval_data.get("overall_reasoning") or eval_data.get("reasoning", ""),
-                    raw_llm_response=eval_data,
-                )
-                await evaluation_repo.create(evaluation_3)
+                for key, model in _EVALUATION_MODELS
+                if (eval_data := evaluation_results.get(key))
+            ]
+
+            evaluation_repo = self.evaluation_repo
+            interview_repo = self.interview_repo
+            pool = await get_pool()
+
+            if pool is not None:
+                # Insert evaluations and mark the interview evaluated atomically
+                async with pool.acquire() as connection:
+                    async with connection.transaction():
+                        await evaluation_repo.create_many(evaluations, connection)
+                        await interview_repo.update_status(
+                            interview_id, "evaluated", connection
+                        )
+            else:
+                # Store all evaluations in one round-trip
+                await evaluation_repo.create_many(evaluations)
 
-            # Update interview status to evaluated
-            update_data = {"status": "evaluated"}
-            self.context_service.interview_repo.supabase.table("interviews").update(
-                update_data
-            ).eq("interview_id", interview_id).execute()
+                # Update interview status to evaluated
+                await interview_repo.update_status(interview_id, "evaluated")
 
             self.logger.info(
                 f"Successfully stored evaluation results for interview: {interview_id}"
@@ -361,7 +599,6 @@ async def main():
 
     try:
         # Validate configuration before starting
-        from ..config import InterviewConfig
         InterviewConfig.validate()
         logging.info("Configuration validated successfully")
     except Exception as e:
@@ -196,7 +196,10 @@ Please evaluate this candidate's interview performance. Provide:
 Format your response as JSON with these keys: score, reasoning, strengths, improvements, recommendation
 """
 
-            response = requests.post(
+            # requests is blocking; run it off the event loop so the other
+            # providers keep making progress while DeepSeek is in flight
+            response = await asyncio.to_thread(
+                requests.post,
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {self.openrouter_key}",
@@ -293,37 +296,7 @@ class EvaluationHelper:
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Process results
-            evaluations = {}
-            scores = []
-
-            for i, result in enumerate(results, 1):
-                key = f"evaluation_{i}"
-                if isinstance(result, Exception):
-                    evaluations[key] = {"error": str(result)}
-                else:
-                    evaluations[key] = result
-                    if "overall_score" in result and isinstance(result["overall_score"], (int, float)):
-                        scores.append(result["overall_score"])
-
-            # Calculate overall score
-            overall_score = sum(scores) / len(scores) if scores else 0
-
-            # Determine recommendation based on average score
-            if overall_score >= 8.5:
-                recommendation = "Strong Yes"
-            elif overall_score >= 7.0:
-                recommendation = "Maybe"
-            else:
-                recommendation = "No"
-
-            return {
-                "interview_id": interview_id,
-                "evaluations": evaluations,
-                "overall_score": round(overall_score, 1),
-                "recommendation": recommendation,
-                "evaluated_at": str(datetime.now()),
-            }
+            return EvaluationHelper.combine_evaluations(interview_id, results)
 
         except Exception as e:
             return {
@@ -332,6 +305,42 @@ class EvaluationHelper:
                 "error": str(e),
             }
 
+    @staticmethod
+    def combine_evaluations(
+        interview_id: str, results: list, evaluated_at: str = None
+    ) -> Dict[str, Any]:
+        """Combine per-provider results (OpenAI, Google, DeepSeek order) into one evaluation"""
+        evaluations = {}
+        scores = []
+
+        for i, result in enumerate(results, 1):
+            key = f"evaluation_{i}"
+            if isinstance(result, Exception):
+                evaluations[key] = {"error": str(result)}
+            else:
+                evaluations[key] = result
+                if "overall_score" in result and isinstance(result["overall_score"], (int, float)):
+                    scores.append(result["overall_score"])
+
+        # Calculate overall score
+        overall_score = sum(scores) / len(scores) if scores else 0
+
+        # Determine recommendation based on average score
+        if overall_score >= 8.5:
+            recommendation = "Strong Yes"
+        elif overall_score >= 7.0:
+            recommendation = "Maybe"
+        else:
+            recommendation = "No"
+
+        return {
+            "interview_id": interview_id,
+            "evaluations": evaluations,
+            "overall_score": round(overall_score, 1),
+            "recommendation": recommendation,
+            "evaluated_at": evaluated_at or str(datetime.now()),
+        }
+
 
 # --- Step 1: Data Loading Function ---
 
@@ -3,6 +3,7 @@ Interview domain entity for managing interview evaluation data.
 """
 
 import json
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import uuid
@@ -65,12 +66,12 @@ class Rubric:
         )
 
 
+@dataclass(slots=True, frozen=True)
 class TranscriptEntry:
     """Single entry in structured transcript"""
 
-    def __init__(self, speaker: str, text: str):
-        self.speaker = speaker  # "interviewer" or "candidate"
-        self.text = text
+    speaker: str  # "interviewer" or "candidate"
+    text: str
 
     def to_dict(self) -> Dict[str, str]:
         return {"speaker": self.speaker, "text": self.text}
@@ -109,13 +110,13 @@ class TranscriptData:
         )
 
 
+@dataclass(slots=True, frozen=True)
 class QuestionAnswer:
     """Question and answer pair with ideal answer"""
 
-    def __init__(self, position: int, question_text: str, ideal_answer: str):
-        self.position = position
-        self.question_text = question_text
-        self.ideal_answer = ideal_answer
+    position: int
+    question_text: str
+    ideal_answer: str
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -0,0 +1,54 @@
+"""
+Judge Cache
+File-backed cache of LLM judge responses keyed by model and request hash.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+class JudgeCache:
+    """Stores provider evaluation results so identical payloads skip the LLM round-trip"""
+
+    def __init__(self, cache_dir: str = ".judge_cache"):
+        self.cache_dir = Path(cache_dir)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Hash the evaluation request (transcript, job description, prompt)"""
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _path(self, model: str, key: str) -> Path:
+        # Model names like "deepseek/deepseek-chat" are not valid directory names
+        return self.cache_dir / model.replace("/", "_") / f"{key}.json"
+
+    async def get(self, model: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for model/key, or None on a miss"""
+        path = self._path(model, key)
+        try:
+            content = await asyncio.to_thread(path.read_text, encoding="utf-8")
+            return json.loads(content)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable judge cache entry {path}: {e}")
+            return None
+
+    async def set(self, model: str, key: str, result: Dict[str, Any]) -> None:
+        """Store a provider result for model/key"""
+        path = self._path(model, key)
+
+        def _write():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result), encoding="utf-8")
+
+        try:
+            await asyncio.to_thread(_write)
+        except Exception as e:
+            self.logger.warning(f"Failed to write judge cache entry {path}: {e}")
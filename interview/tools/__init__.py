@@ -7,6 +7,7 @@ from .interview_tools import (
     clean_context_schema,
     end_fn_schema,
     get_interview_tools_schema,
+    prefetch_farewell_audio,
     set_context_aggregator,
 )
 
@@ -16,5 +17,6 @@ __all__ = [
     "clean_context_schema",
     "end_fn_schema",
     "get_interview_tools_schema",
+    "prefetch_farewell_audio",
     "set_context_aggregator",
 ]
@@ -6,7 +6,16 @@ Tools that can be called by the LLM during interview conversations
 import logging
 from typing import Optional
 
-from pipecat.frames.frames import TTSSpeakFrame, EndTaskFrame
+import httpx
+
+from pipecat.frames.frames import (
+    EndTaskFrame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.llm_service import FunctionCallParams
 from pipecat.adapters.schemas.function_schema import FunctionSchema
@@ -16,12 +25,22 @@ logger = logging.getLogger(__name__)
 
 # Global reference to context aggregator (set by the bot)
 _context_aggregator = None
+# Initial system prompt message, kept when the context is cleaned (set by the bot)
+_initial_system_msg = None
 
+FAREWELL_MESSAGE = (
+    "Okay, thank you for joining us today. I'll be ending the session now."
+)
+FAREWELL_SAMPLE_RATE = 24000
+# 16-bit mono PCM of FAREWELL_MESSAGE (set by prefetch_farewell_audio)
+_farewell_audio: Optional[bytes] = None
 
-def set_context_aggregator(aggregator):
-    """Set the global context aggregator reference for tool access"""
-    global _context_aggregator
+
+def set_context_aggregator(aggregator, initial_system_msg: Optional[dict] = None):
+    """Set the global context aggregator (and initial system message) for tool access"""
+    global _context_aggregator, _initial_system_msg
     _context_aggregator = aggregator
+    _initial_system_msg = initial_system_msg
 
 
 async def clean_context_and_summarize(params: FunctionCallParams):
@@ -52,19 +71,15 @@ async def clean_context_and_summarize(params: FunctionCallParams):
 
     logger.info(f"Current context has {len(current_messages)} messages")
 
-    # Preserve initial system prompt
-    initial_system_msg = next(
+    # Preserve initial system prompt (scan only if the bot didn't register it)
+    initial_system_msg = _initial_system_msg or next(
         (msg for msg in current_messages if msg["role"] == "system"), None
     )
 
-    # Create new cleaned context
-    cleaned_messages = []
-    if initial_system_msg:
-        cleaned_messages.append(initial_system_msg)
-
-    # Add the summary as a system message
-    cleaned_messages.append(
-        {"role": "system", "content": f"Interview Progress Summary: {summary}"}
+    # Create new cleaned context with the summary as a system message
+    summary_msg = {"role": "system", "content": f"Interview Progress Summary: {summary}"}
+    cleaned_messages = (
+        [initial_system_msg, summary_msg] if initial_system_msg else [summary_msg]
     )
 
     # Reset context to cleaned version
@@ -85,14 +100,46 @@ async def clean_context_and_summarize(params: FunctionCallParams):
     )
 
 
+async def prefetch_farewell_audio(
+    api_key: str, voice_id: str, model: str = "eleven_flash_v2_5"
+):
+    """Synthesize the farewell once with the ElevenLabs REST API, so ending
+    the conversation doesn't wait on TTS"""
+    global _farewell_audio
+    if _farewell_audio is not None or not api_key or not voice_id:
+        return
+
+    try:
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            response = await client.post(
+                f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}",
+                params={"output_format": f"pcm_{FAREWELL_SAMPLE_RATE}"},
+                headers={"xi-api-key": api_key},
+                json={"text": FAREWELL_MESSAGE, "model_id": model},
+            )
+            response.raise_for_status()
+            _farewell_audio = response.content
+        logger.info("Farewell audio synthesized")
+    except Exception as e:
+        logger.warning(f"Could not pre-synthesize farewell audio: {e}")
+
+
 async def end_conversation(params: FunctionCallParams):
     """Tool for LLM to end the conversation"""
-    await params.llm.push_frame(
-        TTSSpeakFrame(
-            "Okay, thank you for joining us today. I'll be ending the session now."
-        ),
-        FrameDirection.DOWNSTREAM,
-    )
+    if _farewell_audio:
+        # The text frame is what the transcript and the assistant context
+        # record; the TTS service would have produced it alongside the audio
+        for frame in (
+            TTSStartedFrame(),
+            TTSTextFrame(FAREWELL_MESSAGE),
+            TTSAudioRawFrame(_farewell_audio, FAREWELL_SAMPLE_RATE, 1),
+            TTSStoppedFrame(),
+        ):
+            await params.llm.push_frame(frame, FrameDirection.DOWNSTREAM)
+    else:
+        await params.llm.push_frame(
+            TTSSpeakFrame(FAREWELL_MESSAGE), FrameDirection.DOWNSTREAM
+        )
     await params.llm.push_frame(EndTaskFrame(), FrameDirection.UPSTREAM)
 
 
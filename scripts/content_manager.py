@@ -132,10 +132,11 @@ class ContentManager:
 
     def validate_relationships(self, job_id: str) -> Dict:
         """Validate that a job's question relationships are optimal."""
-        # Get job tags
+        # Get job tags with its relationships and their question tags embedded,
+        # so the whole check is a single request instead of one per question
         job = (
             self.client.table("jobs")
-            .select("required_tags")
+            .select("required_tags, job_questions(question_id, position, questions(tags))")
             .eq("job_id", job_id)
             .execute()
         )
@@ -143,41 +144,27 @@ class ContentManager:
             return {"valid": False, "error": "Job not found"}
 
         job_tags = set(job.data[0]["required_tags"])
-
-        # Get current relationships
-        relationships = (
-            self.client.table("job_questions")
-            .select("question_id, position")
-            .eq("job_id", job_id)
-            .execute()
-        )
+        relationships = job.data[0]["job_questions"] or []
 
         total_overlap = 0
         issues = []
 
-        for rel in relationships.data:
-            question = (
-                self.client.table("questions")
-                .select("tags")
-                .eq("question_id", rel["question_id"])
-                .execute()
-            )
-            if question.data:
-                question_tags = set(question.data[0]["tags"])
+        for rel in relationships:
+            question = rel.get("questions")
+            if question:
+                question_tags = set(question["tags"])
                 overlap = len(job_tags.intersection(question_tags))
                 total_overlap += overlap
 
                 if overlap == 0:
                     issues.append(f"Question {rel['question_id']} has no tag overlap")
 
-        avg_overlap = (
-            total_overlap / len(relationships.data) if relationships.data else 0
-        )
+        avg_overlap = total_overlap / len(relationships) if relationships else 0
 
         return {
             "valid": len(issues) == 0 and avg_overlap >= 2,
             "average_overlap": avg_overlap,
-            "total_questions": len(relationships.data),
+            "total_questions": len(relationships),
             "issues": issues,
         }
 
@@ -2,10 +2,21 @@ import supabase
 from config import Config
 from .automated_tagger import AutomatedTagger
 
+# Shared client so each step reuses one connection instead of rebuilding it
+_client = None
+
+
+def get_client():
+    """Get singleton Supabase client"""
+    global _client
+    if _client is None:
+        _client = supabase.create_client(Config.SUPABASE_URL, Config.SUPABASE_ANON_KEY)
+    return _client
+
 
 def update_all_jobs_with_new_tags():
     """Update all jobs in database with improved automated tags"""
-    client = supabase.create_client(Config.SUPABASE_URL, Config.SUPABASE_ANON_KEY)
+    client = get_client()
     tagger = AutomatedTagger()
 
     # Get all jobs
@@ -34,7 +45,7 @@ def update_all_jobs_with_new_tags():
 
 def regenerate_job_questions_relationships():
     """Regenerate job_questions table based on tag matching"""
-    client = supabase.create_client(Config.SUPABASE_URL, Config.SUPABASE_ANON_KEY)
+    client = get_client()
 
     # Clear existing relationships
     print("Clearing existing job_questions relationships...")
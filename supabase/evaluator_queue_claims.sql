@@ -0,0 +1,33 @@
+-- Lease-based claiming of evaluator_queue rows
+-- Each background evaluator claims a batch with claim_evaluator_tasks(), which
+-- pushes the rows' available_at past the lease so no other worker picks them
+-- up. A worker deletes a row once it has been evaluated; if the worker dies,
+-- the row becomes claimable again when its lease expires. A failed evaluation
+-- increments attempts and sets available_at to a growing retry delay, so a
+-- row that keeps failing neither hammers the LLM providers nor blocks the rows
+-- queued behind it.
+
+ALTER TABLE public.evaluator_queue
+    ADD COLUMN IF NOT EXISTS available_at timestamptz NOT NULL DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS attempts integer NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS evaluator_queue_available_at_idx
+    ON public.evaluator_queue (available_at, created_at);
+
+CREATE OR REPLACE FUNCTION claim_evaluator_tasks(batch_size integer, lease_seconds integer)
+RETURNS SETOF public.evaluator_queue
+LANGUAGE sql
+AS $$
+    UPDATE public.evaluator_queue AS q
+    SET available_at = now() + make_interval(secs => lease_seconds)
+    WHERE q.interview_id IN (
+        SELECT interview_id
+        FROM public.evaluator_queue
+        WHERE available_at <= now()
+        ORDER BY created_at
+        LIMIT batch_size
+        -- Concurrent claimers skip each other's rows instead of waiting on them
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING q.*;
+$$;
@@ -0,0 +1,19 @@
+-- Notify listeners whenever a new evaluation task lands in evaluator_queue
+-- The background evaluator LISTENs on this channel instead of polling the table
+
+CREATE OR REPLACE FUNCTION notify_evaluator_queue_new()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify('evaluator_queue_new', NEW.interview_id::text);
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS evaluator_queue_new_notify ON public.evaluator_queue;
+
+CREATE TRIGGER evaluator_queue_new_notify
+    AFTER INSERT ON public.evaluator_queue
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_evaluator_queue_new();